@@ -0,0 +1,74 @@
+"""
+Benchmark of the time taken to import everstone in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_import.py --output results.json
+    python benchmarks/bench_import.py --output new.json --compare results.json
+"""
+
+from __future__ import annotations
+
+import pathlib
+import statistics
+import subprocess
+import sys
+import typing as t
+
+import common
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = ("everstone", "everstone.database", "everstone.sql")
+
+
+def import_times(module: str) -> t.Dict[str, float]:
+    """Import a module in a new interpreter, returning the cumulative import time of each module in seconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def bench(module: str, *, repeat: int = 10) -> t.Dict[str, t.Any]:
+    """Time importing a module, also reporting whether the database driver was imported with it."""
+    runs = [import_times(module) for _ in range(repeat)]
+    times = [run[module] for run in runs]
+    return {
+        "name": "import",
+        "params": {"module": module},
+        "number": repeat,
+        "best": min(times),
+        "mean": statistics.mean(times),
+        "asyncpg": any("asyncpg" in run for run in runs),
+    }
+
+
+def run(modules: t.Sequence[str] = DEFAULT_MODULES, repeat: int = 10) -> t.List[t.Dict[str, t.Any]]:
+    """Time importing each of the given modules."""
+    return [bench(module, repeat=repeat) for module in modules]
+
+
+def main():
+    """Run the benchmarks from the command line, writing a JSON report."""
+    parser = common.parser(__doc__)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES, help="Modules to time importing.")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of fresh interpreters to import in.")
+    args = parser.parse_args()
+
+    results = run(args.modules, args.repeat)
+    common.report(results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Microbenchmarks for SQL generation, run without a database connection.
+
+Usage:
+    python benchmarks/bench_sql.py --output results.json
+    python benchmarks/bench_sql.py --output new.json --compare results.json
+"""
+
+from __future__ import annotations
+
+import pathlib
+import statistics
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+import common
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from everstone.database import Database  # noqa: E402
+from everstone.sql import aggregates, types  # noqa: E402
+from everstone.sql.table import Table  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+ALLOCATIONS = 10000
+
+
+def bench(name: str, func: t.Callable[[], t.Any], *, repeat: int = 5, **params) -> t.Dict[str, t.Any]:
+    """Time a function, returning the best and mean time per call in seconds."""
+    result = {"name": name, "params": params}
+    timer = timeit.Timer(func)
+    try:
+        number, _ = timer.autorange()
+        times = [total / number for total in timer.repeat(repeat, number)]
+    except RecursionError as e:
+        result["error"] = type(e).__name__
+        return result
+    result.update(number=number, best=min(times), mean=statistics.mean(times))
+    return result
+
+
+def allocations(name: str, func: t.Callable[[], t.Any], *, number: int = ALLOCATIONS) -> t.Dict[str, t.Any]:
+    """Measure the memory and number of memory blocks retained by the result of each call of a function."""
+    results = [None] * number
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(number):
+            results[i] = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return {"name": name, "params": {"objects": number}, "bytes": size / number, "blocks": blocks / number}
+
+
+def make_table(db: Database, size: int) -> Table:
+    """Declare a table with the given number of integer columns."""
+    table = db.Table(f"bench_table_{size}")
+    for i in range(size):
+        table.Column(f"col_{i}", types.Integer)
+    return table
+
+
+def bench_select(db: Database, size: int) -> t.Dict[str, t.Any]:
+    """Time rendering a select of a table with the given number of columns."""
+    table = make_table(db, size)
+    cols = list(table.columns)
+    select = table.select(*cols)
+    select.where(*(col > i for i, col in enumerate(cols[:10])))
+    return bench("select.sql", lambda: select.sql, columns=size)
+
+
+def bench_and_chain(db: Database, size: int) -> t.Dict[str, t.Any]:
+    """Time combining the given number of conditions one at a time with &, then rendering them."""
+    col = make_table(db, 1).columns.col_0
+    conditions = [col == i for i in range(size)]
+
+    def chain() -> str:
+        condition = conditions[0]
+        for other in conditions[1:]:
+            condition = condition & other
+        return condition.compile([])
+
+    return bench("condition.and_chain", chain, terms=size)
+
+
+def bench_and_(db: Database, size: int) -> t.Dict[str, t.Any]:
+    """Time combining the given number of conditions in a single and_ call, then rendering them."""
+    col = make_table(db, 1).columns.col_0
+    conditions = [col == i for i in range(size)]
+    return bench("condition.and_", lambda: conditions[0].and_(*conditions[1:]).compile([]), terms=size)
+
+
+def bench_operators(db: Database) -> t.Dict[str, t.Any]:
+    """Time creating a condition with each comparison operator of a column."""
+    col = make_table(db, 1).columns.col_0
+
+    def operators() -> t.Tuple[t.Any, ...]:
+        return (
+            col < 1, col <= 1, col == 1, col != 1, col > 1, col >= 1,
+            col.like("a"), col.ilike("a"), col.between(1, 2), col.is_(None), col.in_([1, 2, 3]),
+        )
+
+    return bench("comparable.operators", operators)
+
+
+def bench_modifiers(db: Database) -> t.Dict[str, t.Any]:
+    """Time applying sort direction and alias modifiers to a column."""
+    col = make_table(db, 1).columns.col_0
+    return bench("column.modifiers", lambda: (col.asc, col.desc, col.as_("alias")))
+
+
+def bench_allocations(db: Database) -> t.List[t.Dict[str, t.Any]]:
+    """Measure the memory retained by each kind of query object."""
+    table = make_table(db, 2)
+    col = table.columns.col_0
+    other = table.columns.col_1
+    return [
+        allocations("alloc.column", lambda: table.Column("col_0", types.Integer)),
+        allocations("alloc.column.asc", lambda: col.asc),
+        allocations("alloc.column.as_", lambda: col.as_("alias")),
+        allocations("alloc.condition", lambda: col == 1),
+        allocations("alloc.condition.and", lambda: (col == 1) & (other > 2)),
+        allocations("alloc.aggregate", lambda: aggregates.Max(col)),
+        allocations("alloc.select", lambda: table.select(col, other)),
+    ]
+
+
+def bench_create(db: Database, size: int) -> t.Dict[str, t.Any]:
+    """Time rendering the creation statement of a table with the given number of columns."""
+    table = make_table(db, size)
+    return bench("table.create_sql", table.create_sql, columns=size)
+
+
+def run(sizes: t.Sequence[int] = DEFAULT_SIZES) -> t.List[t.Dict[str, t.Any]]:
+    """Run every benchmark, those that scale at each of the given sizes."""
+    db = Database("everstone_benchmarks")
+    db.disable_execution()
+    results = [bench_operators(db), bench_modifiers(db), *bench_allocations(db)]
+    for size in sizes:
+        results += [bench_select(db, size), bench_and_chain(db, size), bench_and_(db, size), bench_create(db, size)]
+    return results
+
+
+def main():
+    """Run the benchmarks from the command line, writing a JSON report."""
+    parser = common.parser(__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Column and term counts to run.")
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    common.report(results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Helpers shared by the benchmark scripts for writing and comparing JSON reports."""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import importlib.metadata
+import json
+import pathlib
+import platform
+import typing as t
+
+Results = t.List[t.Dict[str, t.Any]]
+
+
+def parser(description: str) -> argparse.ArgumentParser:
+    """Return an argument parser with the output and compare options of every benchmark script."""
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=pathlib.Path, help="File to write JSON results to.")
+    parser.add_argument("--compare", type=pathlib.Path, help="JSON results of a previous run to compare against.")
+    return parser
+
+
+def compare(results: Results, baseline: Results):
+    """Print the change in best time, or allocated bytes, of each benchmark against a baseline."""
+    old = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in baseline}
+    lines = []
+    for result in results:
+        key = (result["name"], json.dumps(result["params"], sort_keys=True))
+        metric = "best" if "best" in result else "bytes"
+        before = old.get(key, dict()).get(metric)
+        after = result.get(metric)
+        params = " ".join(f"{k}={v}" for k, v in result["params"].items())
+        if before and after:
+            change = f"{after / before:.2f}x"
+        else:
+            change = "n/a"
+        lines.append((result["name"], params, change))
+    width = max((len(params) for _, params, _ in lines), default=0)
+    for name, params, change in lines:
+        print(f"{name:<24} {params:<{width}} {change}")
+
+
+def report(results: Results, args: argparse.Namespace):
+    """Write the results with details of the environment, comparing them against a baseline if given."""
+    try:
+        version = importlib.metadata.version("everstone")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    data = {
+        "everstone": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(data, indent=2))
+    else:
+        print(json.dumps(data, indent=2))
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text())["results"])
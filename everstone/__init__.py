@@ -1,3 +1,4 @@
+from .codecs import JSONCodec, LazyJSON
 from .database import Database
 from .sql import aggregates, constraints, types
 from .sql.column import Column
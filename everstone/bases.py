@@ -1,17 +1,86 @@
+import collections
+import threading
 import typing as t
+import weakref
+
+DEFAULT_RETAINED = 128
+
+
+class InstanceRegistry(t.MutableMapping[str, object]):
+    """
+    Weakly referenced instances by name, keeping the most recently used ones alive.
+
+    Instances stay registered for as long as they're referenced anywhere, so there's only ever one per name. Up to
+    `retained` of the most recently used are also kept alive when not referenced elsewhere, evicting the least recently
+    used when over that bound, or all of them are if it's None.
+    """
+
+    def __init__(self, retained: t.Optional[int] = DEFAULT_RETAINED):
+        self.retained = retained
+        self.lock = threading.RLock()
+        self._refs: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._recent: t.OrderedDict[str, object] = collections.OrderedDict()
+
+    def __repr__(self):
+        return f"<InstanceRegistry instances={len(self)} retained={len(self._recent)}>"
+
+    def __getitem__(self, name: str) -> object:
+        with self.lock:
+            instance = self._refs[name]
+            self._retain(name, instance)
+            return instance
+
+    def __setitem__(self, name: str, instance: object):
+        with self.lock:
+            self._refs[name] = instance
+            self._retain(name, instance)
+
+    def __delitem__(self, name: str):
+        with self.lock:
+            del self._refs[name]
+            self._recent.pop(name, None)
+
+    def __iter__(self) -> t.Iterator[str]:
+        with self.lock:
+            return iter(list(self._refs.keys()))
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, name: t.Any) -> bool:
+        return name in self._refs
+
+    def clear(self):
+        """Remove all registered instances, including those kept alive as recently used."""
+        with self.lock:
+            self._recent.clear()
+            self._refs.clear()
+
+    def _retain(self, name: str, instance: object):
+        """Keep an instance alive as recently used, releasing the least recently used when over the bound."""
+        if self.retained == 0:
+            return
+        self._recent[name] = instance
+        self._recent.move_to_end(name)
+        if self.retained is not None:
+            while len(self._recent) > self.retained:
+                self._recent.popitem(last=False)
 
 
 class LimitInstances:
     """Ensures only a single instance exists per name, returning old ones if existing."""
 
-    __instances__: t.Dict[str, object] = dict()
+    __instances__: InstanceRegistry = InstanceRegistry()
+    __retained__: t.Optional[int] = DEFAULT_RETAINED
 
     def __new__(cls, name: str, *args, **kwds):
         """Set the class to a single instance per name."""
-        instance = cls.__instances__.get(name)
-        if instance is None:
-            cls.__instances__[name] = instance = object.__new__(cls)
-        return instance
+        instances = cls.__instances__
+        with instances.lock:
+            instance = instances.get(name)
+            if instance is None:
+                instances[name] = instance = object.__new__(cls)
+            return instance
 
     def __init_subclass__(cls, **kwargs):
-        cls.__instances__ = dict()
+        cls.__instances__ = InstanceRegistry(cls.__retained__)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import collections
+import sys
+import threading
+import time
+import typing as t
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_REPLICA_LAG = 1.0
+INVALIDATION_CHANNEL = "everstone_invalidation"
+
+
+def sizeof(value: t.Any) -> int:
+    """Estimate the memory used by a result, including the rows and values it contains."""
+    size = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif callable(getattr(obj, "values", None)):
+            stack.extend(obj.values())
+        elif hasattr(obj, "__fields__"):
+            stack.extend(getattr(obj, name) for name in getattr(obj, "__fields__", ()) if hasattr(obj, name))
+    return size
+
+
+def freeze(value: t.Any) -> t.Any:
+    """Convert bound list values to tuples so query arguments can be used in a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class CacheEntry:
+    """A cached result and the tables it was read from."""
+
+    __slots__ = ("value", "tables", "size", "expires")
+
+    def __init__(self, value: t.Any, tables: t.FrozenSet[str], size: int, expires: t.Optional[float]):
+        self.value = value
+        self.tables = tables
+        self.size = size
+        self.expires = expires
+
+
+class ResultCache:
+    """
+    Results of read queries, evicting the least recently used entries when over the entry count or byte size.
+
+    Entries expire after `ttl` seconds if set, and are tagged with the names of the tables they were read from so
+    writes to those tables can invalidate them. Replicas are assumed to apply writes within `replica_lag` seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: t.Optional[float] = None,
+        replica_lag: float = DEFAULT_REPLICA_LAG,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.replica_lag = replica_lag
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: t.OrderedDict[t.Hashable, CacheEntry] = collections.OrderedDict()
+        self._tables: t.Dict[str, t.Set[t.Hashable]] = collections.defaultdict(set)
+        self._invalidated: t.Dict[t.Optional[str], float] = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<ResultCache entries={len(self._entries)} bytes={self.size} hits={self.hits} misses={self.misses}>"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: t.Hashable):
+        return key in self._entries
+
+    @staticmethod
+    def key(method: str, sql: str, args: t.Sequence[t.Any], *options: t.Any) -> t.Optional[t.Hashable]:
+        """Return the key of a query, or None if it's arguments can't be hashed."""
+        key = (method, sql, freeze(args), *options)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """Return the cached result of a query, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and entry.expires <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: t.Hashable, value: t.Any, tables: t.Iterable[str], *, generation: t.Optional[int] = None):
+        """
+        Cache the result of a query read from the given tables, evicting entries until within limits.
+
+        If the generation the query started in is given, the result isn't cached if entries were invalidated since,
+        as it may have been read before a write completed.
+        """
+        size = sizeof(value)
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        entry = CacheEntry(value, frozenset(tables), size, expires)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.size += size
+            for table in entry.tables:
+                self._tables[table].add(key)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tables: t.Optional[t.Iterable[str]] = None):
+        """Remove entries read from any of the given tables, or all entries if no tables are given."""
+        now = time.monotonic()
+        with self._lock:
+            self.generation += 1
+            if tables is None:
+                self._invalidated = {None: now}
+                self._entries.clear()
+                self._tables.clear()
+                self.size = 0
+                return
+            for table in tables:
+                self._invalidated[table] = now
+                for key in self._tables.pop(table, ()):
+                    self._remove(key)
+
+    def lagging(self, tables: t.Iterable[str]) -> bool:
+        """Return whether any of the given tables were invalidated too recently for replicas to have the writes."""
+        since = time.monotonic() - self.replica_lag
+        invalidated = self._invalidated
+        return invalidated.get(None, 0.0) > since or any(invalidated.get(table, 0.0) > since for table in tables)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counts."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def _remove(self, key: t.Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        for table in entry.tables:
+            keys = self._tables.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tables[table]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+from .exceptions import DBError
+
+if t.TYPE_CHECKING:
+    import asyncpg
+
+_JSONB_VERSION = b"\x01"
+
+
+class LazyJSON:
+    """A JSON value that's only decoded when first accessed."""
+
+    __slots__ = ("raw", "_loads", "_value")
+
+    _unset = object()
+
+    def __init__(self, raw: t.Union[str, bytes], loads: t.Callable[[t.Union[str, bytes]], t.Any] = json.loads):
+        self.raw = raw
+        self._loads = loads
+        self._value = self._unset
+
+    @property
+    def value(self) -> t.Any:
+        """The decoded value, decoding it on first access."""
+        if self._value is self._unset:
+            self._value = self._loads(self.raw)
+        return self._value
+
+    @property
+    def decoded(self) -> bool:
+        """Returns True if the value has been decoded."""
+        return self._value is not self._unset
+
+    def __getitem__(self, item: t.Any) -> t.Any:
+        return self.value[item]
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, item: t.Any):
+        return item in self.value
+
+    def __eq__(self, other: t.Any):
+        if isinstance(other, LazyJSON):
+            return self.value == other.value
+        return self.value == other
+
+    def __repr__(self):
+        return f"<LazyJSON {self.raw!r}>"
+
+
+class JSONCodec:
+    """
+    Encoder and decoder used for json and jsonb values on each connection.
+
+    Any serializer with a json.dumps/json.loads style interface can be used, returning either str or bytes. The binary
+    format sends jsonb without text conversion on the server, and lazy decoding returns LazyJSON values so only the
+    values that are accessed get decoded.
+    """
+
+    def __init__(
+        self,
+        dumps: t.Callable[[t.Any], t.Union[str, bytes]] = json.dumps,
+        loads: t.Callable[[t.Union[str, bytes]], t.Any] = json.loads,
+        *,
+        binary: bool = False,
+        lazy: bool = False,
+    ):
+        self.dumps = dumps
+        self.loads = loads
+        self.binary = binary
+        self.lazy = lazy
+
+    @classmethod
+    def orjson(cls, *, binary: bool = True, lazy: bool = False) -> JSONCodec:
+        """Return a codec using orjson, if it's installed."""
+        try:
+            import orjson
+        except ImportError:
+            raise DBError("JSONCodec.orjson requires orjson to be installed.") from None
+        return cls(orjson.dumps, orjson.loads, binary=binary, lazy=lazy)
+
+    def __repr__(self):
+        fmt = "binary" if self.binary else "text"
+        lazy = " lazy" if self.lazy else ""
+        return f"<JSONCodec {getattr(self.dumps, '__module__', None)} {fmt}{lazy}>"
+
+    def encode_text(self, value: t.Any) -> str:
+        """Encode a value as JSON text."""
+        data = self._dumps(value)
+        return data.decode() if isinstance(data, bytes) else data
+
+    def encode_binary(self, value: t.Any) -> bytes:
+        """Encode a value as binary json."""
+        data = self._dumps(value)
+        return data.encode() if isinstance(data, str) else data
+
+    def encode_jsonb(self, value: t.Any) -> bytes:
+        """Encode a value as binary jsonb, which is prefixed by it's format version."""
+        return _JSONB_VERSION + self.encode_binary(value)
+
+    def _dumps(self, value: t.Any) -> t.Union[str, bytes]:
+        """Serialize a value, passing through the raw JSON of LazyJSON values that haven't been decoded."""
+        if isinstance(value, LazyJSON):
+            return self.dumps(value.value) if value.decoded else value.raw
+        return self.dumps(value)
+
+    def decode(self, data: t.Union[str, bytes]) -> t.Any:
+        """Decode a text or binary json value."""
+        if self.lazy:
+            return LazyJSON(data, self.loads)
+        return self.loads(data)
+
+    def decode_jsonb(self, data: bytes) -> t.Any:
+        """Decode a binary jsonb value."""
+        if data[:1] != _JSONB_VERSION:
+            raise DBError(f"Unsupported jsonb format version {data[:1]!r}.")
+        return self.decode(data[1:])
+
+    async def register(self, conn: asyncpg.Connection):
+        """Set this codec for json and jsonb values on a connection."""
+        if self.binary:
+            await conn.set_type_codec(
+                "jsonb", encoder=self.encode_jsonb, decoder=self.decode_jsonb, schema="pg_catalog", format="binary"
+            )
+            await conn.set_type_codec(
+                "json", encoder=self.encode_binary, decoder=self.decode, schema="pg_catalog", format="binary"
+            )
+        else:
+            await conn.set_type_codec("jsonb", encoder=self.encode_text, decoder=self.decode, schema="pg_catalog")
+            await conn.set_type_codec("json", encoder=self.encode_text, decoder=self.decode, schema="pg_catalog")
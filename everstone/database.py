@@ -1,44 +1,112 @@
 from __future__ import annotations
 
 import contextlib
-import json
+import itertools
 import logging
+import time
 import typing as t
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
+
+from .bases import InstanceRegistry, LimitInstances
+from .cache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, DEFAULT_REPLICA_LAG, INVALIDATION_CHANNEL, ResultCache
+from .codecs import JSONCodec
+from .exceptions import DBError, QueryError
+from .metrics import DEFAULT_BUCKETS, DEFAULT_MAX_STATEMENTS, Metrics
+from .sql import catalog, columnar, types
+from .sql.record import Record
+from .sql.schema import Schema
+from .sql.table import Table, dependency_order
 
-import asyncpg
+if t.TYPE_CHECKING:
+    import asyncio
 
-from .bases import LimitInstances
-from .exceptions import DBError
-from .sql import types
-from .sql.schema import Schema
-from .sql.table import Table
+    import asyncpg
 
 log = logging.getLogger(__name__)
 
+_MISSING = object()
+
+COPY_BATCH_SIZE = 10_000
+LISTEN_RETRY_DELAY = 1.0
+LISTEN_RETRY_MAX_DELAY = 60.0
+
+Tables = t.Optional[t.Iterable[t.Union[Table, str]]]
+
+
+async def batches(records: t.AsyncIterable[t.Sequence], size: int) -> t.AsyncIterator[t.List[t.Sequence]]:
+    """Collect the records of an async iterable into lists of up to `size` records."""
+    batch = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 class Database(LimitInstances):
     """Represents a database."""
 
-    __instances__: dict[str, Database]
+    __instances__: InstanceRegistry
 
     def __init__(self, name: str):
+        if hasattr(self, "name"):
+            return  # existing instance returned by LimitInstances, keep it's pool and settings
         self.name = name
         self.user: t.Optional[str] = None
         self.url: t.Optional[str] = None
 
         self.pool: t.Optional[asyncpg.Pool] = None
+        self._pool_lock: t.Optional[asyncio.Lock] = None
+        self.pool_options: t.Dict[str, t.Any] = dict()
+        self.json_codec = JSONCodec()
+        self.metrics: t.Optional[Metrics] = None
+        self.cache: t.Optional[ResultCache] = None
+        self.listener: t.Optional[asyncpg.Connection] = None
+        self._listen_channel = INVALIDATION_CHANNEL
+        self._listener_lost = False
+        self._relisten_task: t.Optional[asyncio.Task] = None
+        self.replicas: t.Dict[str, t.Optional[asyncpg.Pool]] = dict()
+        self._replica_selection = "round_robin"
+        self._replica_index = 0
+        self._acquired: t.Dict[asyncpg.Pool, int] = dict()
 
         self.type = types
         self.schemas: t.Set[Schema] = set()
 
         self._mock = False
         self._prepared = False
+        self._coalesce = False
+        self._in_flight: t.Dict[t.Hashable, t.Tuple[asyncio.Future, t.Optional[t.FrozenSet[str]]]] = dict()
         self._tracking = ContextVar(f"stmt_tracking:{name}")
+        self._primary_reads = ContextVar(f"primary_reads:{name}", default=False)
+        self._connection = ContextVar(f"connection:{name}", default=None)
+        self._pending_invalidation = ContextVar(f"pending_invalidation:{name}", default=None)
 
     @classmethod
-    def connect(cls, name: str, user: str, password: str, *, host: str = "localhost", port: int = 5432) -> Database:
-        """Establish the connection URL and name for the database, returning the instance representing it."""
+    def connect(
+        cls,
+        name: str,
+        user: str,
+        password: str,
+        *,
+        host: str = "localhost",
+        port: int = 5432,
+        min_size: int = 10,
+        max_size: int = 10,
+        max_queries: int = 50000,
+        max_inactive_connection_lifetime: float = 300.0,
+        statement_cache_size: int = 100,
+        setup: t.Optional[t.Callable[[asyncpg.Connection], t.Awaitable]] = None,
+        init: t.Optional[t.Callable[[asyncpg.Connection], t.Awaitable]] = None,
+    ) -> Database:
+        """
+        Establish the connection URL and name for the database, returning the instance representing it.
+
+        Pool sizing, connection recycling, the statement cache size and connection hooks are used when creating the
+        connection pool. `init` is called for every new connection and `setup` every time one is acquired.
+        """
         if len(cls.__instances__) == 1:
             db = cls.__instances__["__default__"]
             cls.__instances__[name] = db
@@ -47,6 +115,15 @@ class Database(LimitInstances):
             db = Database(name)
         db.user = user
         db.url = f"postgres://{user}:{password}@{host}:{port}/{name}"
+        db.pool_options.update(
+            min_size=min_size,
+            max_size=max_size,
+            max_queries=max_queries,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            statement_cache_size=statement_cache_size,
+            setup=setup,
+            init=init,
+        )
         return db
 
     @property
@@ -88,24 +165,217 @@ class Database(LimitInstances):
     def get_default(cls):
         return cls.__instances__["__default__"]
 
-    async def create_pool(self):
-        """Create the asyncpg connection pool for this database connection to use."""
-        if self.pool:
-            self.pool.close()
+    async def create_pool(self, **options):
+        """
+        Create the asyncpg connection pool for this database connection to use.
+
+        Any options given override those set by Database.connect. Existing pools, including those of replicas, are
+        replaced once every new pool is ready, closing them gracefully. If any new pool can't be created, the pools
+        already created are closed and the existing ones are left in place.
+        """
         if not self.url:
             raise DBError("Please define a connection with Database.connect.")
-        self.pool = await asyncpg.create_pool(self.url, init=self._enable_json)  # pragma: no cover
+        self.pool_options.update(options)
+        dsns = list(self.replicas)
+        new_pools = []
+        try:
+            for url in (self.url, *dsns):
+                new_pools.append(await self._create_pool(url))
+        except BaseException:
+            for new_pool in new_pools:
+                await new_pool.close()
+            raise
+        old_pools = [self.pool, *(self.replicas[dsn] for dsn in dsns)]
+        self.pool = new_pools[0]
+        self.replicas.update(zip(dsns, new_pools[1:]))
+        for old_pool in old_pools:
+            if old_pool:
+                await old_pool.close()
+
+    async def _create_pool(self, url: str) -> asyncpg.Pool:
+        """Create an asyncpg connection pool for the given URL using the current pool options."""
+        import asyncpg
+
+        options = self.pool_options.copy()
+        init = options.pop("init", None)
+
+        async def init_connection(conn: asyncpg.Connection):  # pragma: no cover
+            await self._enable_json(conn)
+            if init:
+                await init(conn)
+
+        return await asyncpg.create_pool(url, init=init_connection, **options)  # pragma: no cover
+
+    def add_replica(self, dsn: str):
+        """Register a read replica to route read-only queries to, using it's own connection pool."""
+        self.replicas.setdefault(dsn, None)
 
-    @staticmethod
-    async def _enable_json(conn: asyncpg.Connection):  # pragma: no cover
-        await conn.set_type_codec("jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
-        await conn.set_type_codec("json", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+    @property
+    def replica_selection(self) -> str:
+        """How a replica is chosen for each read, either "round_robin" or "least_busy"."""
+        return self._replica_selection
+
+    @replica_selection.setter
+    def replica_selection(self, value: str):
+        if value not in ("round_robin", "least_busy"):
+            raise DBError(f"Unknown replica selection '{value}', use 'round_robin' or 'least_busy'.")
+        self._replica_selection = value
+
+    @contextlib.contextmanager
+    def primary(self):
+        """Route read-only queries to the primary until exit, for reads that must see prior writes."""
+        ctx_token = self._primary_reads.set(True)
+        try:
+            yield self
+        finally:
+            self._primary_reads.reset(ctx_token)
+
+    async def _executor(self, readonly: bool = False) -> t.Union[asyncpg.Pool, asyncpg.Connection]:
+        """
+        Return the connection or pool to run a query on.
+
+        Queries use the connection pinned by Database.transaction if any, otherwise read-only queries are routed to a
+        replica if any are registered.
+        """
+        conn = self._connection.get()
+        if conn is not None:
+            return conn
+        if not self.pool:
+            await self._ensure_pool()
+        if not readonly or not self.replicas or self._primary_reads.get():
+            return self.pool
+        if not all(self.replicas.values()):
+            await self._ensure_pool()
+        return self._select_replica()
+
+    async def _ensure_pool(self):
+        """Create the connection pools on first use, with concurrent first queries waiting on the same pools."""
+        import asyncio
+
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if not self.pool:
+                await self.create_pool()
+            for dsn, pool in self.replicas.items():
+                if not pool:
+                    self.replicas[dsn] = await self._create_pool(dsn)
+
+    @contextlib.asynccontextmanager
+    async def transaction(
+        self,
+        *,
+        isolation: t.Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> t.AsyncIterator[t.Optional[asyncpg.Connection]]:
+        """
+        Run all executions on this database within a single transaction on one pinned connection until exit.
+
+        The transaction is committed on exit, or rolled back if an exception is raised. Nested transactions use
+        savepoints on the same connection.
+        """
+        if self._mock:
+            modes = [f"ISOLATION LEVEL {isolation.replace('_', ' ').upper()}"] if isolation else []
+            modes += ["READ ONLY"] if readonly else []
+            modes += ["DEFERRABLE"] if deferrable else []
+            self._mock_execute(" ".join(["BEGIN", *modes]) + ";", ())
+            pending_token = self._pending_invalidation.set([])
+            try:
+                yield None
+            except BaseException:
+                self._mock_execute("ROLLBACK;", ())
+                raise
+            finally:
+                self._flush_invalidation(pending_token)
+            self._mock_execute("COMMIT;", ())
+            return
+
+        conn = self._connection.get()
+        if conn is not None:
+            async with conn.transaction(isolation=isolation, readonly=readonly, deferrable=deferrable):
+                yield conn
+            return
+
+        pool = await self._executor()
+        pending_token = self._pending_invalidation.set([])
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction(isolation=isolation, readonly=readonly, deferrable=deferrable):
+                    ctx_token = self._connection.set(conn)
+                    try:
+                        yield conn
+                    finally:
+                        self._connection.reset(ctx_token)
+        finally:
+            self._flush_invalidation(pending_token)
+
+    def _flush_invalidation(self, ctx_token: Token):
+        """Invalidate cached results of tables written to within a transaction again, once it's finished."""
+        pending = self._pending_invalidation.get()
+        self._pending_invalidation.reset(ctx_token)
+        for tables in pending:
+            self._invalidate(tables)
+
+    def _select_replica(self) -> asyncpg.Pool:
+        """Choose a replica pool using the current replica selection."""
+        pools = list(self.replicas.values())
+        if self._replica_selection == "least_busy":
+            return min(pools, key=lambda p: self._acquired.get(p, 0))
+        self._replica_index = (self._replica_index + 1) % len(pools)
+        return pools[self._replica_index - 1]
+
+    async def _enable_json(self, conn: asyncpg.Connection):  # pragma: no cover
+        await self.json_codec.register(conn)
+
+    async def prepare(self, *, sync: bool = False) -> t.Optional[catalog.CatalogDiff]:
+        """
+        Prepare all child objects for this database.
+
+        Schemas are created concurrently, then tables are created concurrently in order of their foreign key
+        dependencies.
+
+        If sync is set, the database catalog is read first and only the missing schemas, tables, columns and named
+        constraints are created, returning the differences found. Drift that isn't fixed automatically is logged.
+        """
+        if sync:
+            return await self._sync()
+
+        await self.gather(*(schema.create(if_exists=False) for schema in self.schemas))
+        tables = itertools.chain.from_iterable(schema.tables for schema in self.schemas)
+        for level in dependency_order(tables):
+            await self.gather(*(table.prepare() for table in level))
+        self._prepared = True
+
+    async def _sync(self) -> catalog.CatalogDiff:
+        """Create only what's missing from the database catalog for all child objects of this database."""
+        rows = await self.fetch(catalog.CATALOG_QUERY, [schema.name for schema in self.schemas])
+        changes = catalog.diff(self.schemas, [] if self._mock else rows)
+        for drift in changes.drift:
+            log.warning(drift)
+
+        await self.gather(*(self.execute(sql) for sql in changes.schemas))
+        for level in changes.tables:
+            await self.gather(*(self.execute(sql) for sql in level))
+        for sql in changes.alterations:
+            await self.execute(sql)
 
-    async def prepare(self):
-        """Prepare all child objects for this database."""
         for schema in self.schemas:
-            await schema.prepare()
+            schema._exists = True
         self._prepared = True
+        return changes
+
+    async def gather(self, *aws: t.Awaitable) -> t.List[t.Any]:
+        """
+        Run awaitables concurrently across pool connections, returning their results.
+
+        They're run one after another instead if a connection is pinned, as it can only run one query at a time.
+        """
+        import asyncio
+
+        if self._connection.get() is not None:
+            return [await aw for aw in aws]
+        return list(await asyncio.gather(*aws))
 
     def disable_execution(self):
         """Return generated SQL without executing when Database.execute is used."""
@@ -125,26 +395,527 @@ class Database(LimitInstances):
             self._tracking.reset(ctx_token)
 
     async def close(self):  # pragma: no cover
-        """Close the asyncpg connection pool for this database."""
-        if self.pool:
-            await self.pool.close()
-
-    async def execute(self, sql: str, *args, timeout: t.Optional[float] = None) -> t.Union[str, tuple[str, t.Any]]:
-        """Execute an SQL statement."""
+        """Close the asyncpg connection pools and listening connection for this database."""
+        await self.unlisten()
+        for pool in (self.pool, *self.replicas.values()):
+            if pool:
+                await pool.close()
+
+    def enable_instrumentation(
+        self,
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+        max_statements: int = DEFAULT_MAX_STATEMENTS,
+    ) -> Metrics:
+        """Start recording per-statement metrics for all executions, returning the metrics collected."""
+        self.metrics = Metrics(buckets, max_statements)
+        return self.metrics
+
+    def disable_instrumentation(self):
+        """Stop recording per-statement metrics."""
+        self.metrics = None
+
+    def enable_cache(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: t.Optional[float] = None,
+        replica_lag: float = DEFAULT_REPLICA_LAG,
+    ) -> ResultCache:
+        """
+        Start caching the results of read-only queries of known tables, returning the cache.
+
+        Results are evicted least recently used first when over the entry count or size in bytes, and expire after
+        `ttl` seconds if set. Writes executed on this database invalidate the cached results of the tables written to.
+        Results read from a replica within `replica_lag` seconds of a write to their tables aren't cached, as the
+        replica may not have applied the write yet. Cached Record rows are copied for each query, so changing them
+        doesn't change the cached result.
+        """
+        self.cache = ResultCache(max_entries, max_bytes, ttl, replica_lag)
+        return self.cache
+
+    def disable_cache(self):
+        """Stop caching query results."""
+        self.cache = None
+
+    def enable_coalescing(self):
+        """
+        Share a single execution between identical read-only queries running at the same time.
+
+        Waiting queries receive the result of the query already running, so a burst of identical reads such as those
+        following a cache miss only makes a single round trip. Writes to the tables a running query reads from stop
+        later queries from waiting on it, and queries reading from the primary with Database.primary never wait.
+        """
+        self._coalesce = True
+
+    def disable_coalescing(self):
+        """Execute every read-only query separately."""
+        self._coalesce = False
+
+    async def listen(self, channel: str = INVALIDATION_CHANNEL):
+        """
+        Invalidate cached results when table change events are received on a notification channel.
+
+        Events are sent by the triggers created with Table.create_notify_trigger, so writes by other processes
+        invalidate the cache of this one. A dedicated connection outside of the pool is kept open for listening. If
+        it's lost, the whole cache is invalidated, as events may have been missed, and results aren't cached again
+        until it's reconnected, which is retried with exponential backoff.
+        """
+        await self.unlisten()
+        self._listen_channel = channel
+        await self._listen(channel)
+
+    async def unlisten(self):
+        """Stop listening for table change events, closing the listening connection."""
+        task, self._relisten_task = self._relisten_task, None
+        if task is not None:
+            task.cancel()
+        self._listener_lost = False
+        listener, self.listener = self.listener, None
+        if listener is not None:  # pragma: no cover
+            listener.remove_termination_listener(self._on_listener_lost)
+            await listener.close()
+
+    async def _listen(self, channel: str):
+        """Open the listening connection, allowing results to be cached again once it's listening."""
         if self._mock:
+            self._mock_execute(f"LISTEN {channel};", ())
+            self._listener_lost = False
+            return
+        if not self.url:  # pragma: no cover
+            raise DBError("Please define a connection with Database.connect.")
+
+        import asyncpg  # pragma: no cover
+
+        listener = await asyncpg.connect(self.url)  # pragma: no cover
+        try:  # pragma: no cover
+            listener.add_termination_listener(self._on_listener_lost)
+            await listener.add_listener(channel, self._on_notify)
+        except BaseException:  # pragma: no cover
+            listener.remove_termination_listener(self._on_listener_lost)
+            await listener.close()
+            raise
+        self.listener = listener  # pragma: no cover
+        self._listener_lost = False  # pragma: no cover
+
+    async def _relisten(self, channel: str):
+        """Reopen a lost listening connection, retrying with exponential backoff until it succeeds."""
+        import asyncio
+
+        delay = LISTEN_RETRY_DELAY
+        while True:
+            await asyncio.sleep(delay)
             try:
-                stmt_list = self._tracking.get()
-                stmt_list.append((sql, args))
-            except LookupError:
-                pass
-            if not args:
-                return sql
+                await self._listen(channel)
+            except Exception as e:
+                log.warning(f"Failed to reconnect the listening connection of {self!r}: {e}")
+                delay = min(delay * 2, LISTEN_RETRY_MAX_DELAY)
             else:
-                return sql, *args
+                break
+        self._relisten_task = None
 
-        if not self.pool:  # pragma: no cover
-            await self.create_pool()
-        return await self.pool.execute(sql, *args, timeout=timeout)  # pragma: no cover
+    def _on_notify(self, conn: asyncpg.Connection, pid: int, channel: str, payload: str):
+        """Invalidate the cached results of the table named by a change event, or all results if it's empty."""
+        self._invalidate([payload] if payload else None)
+
+    def _on_listener_lost(self, conn: asyncpg.Connection):
+        """Invalidate all cached results and stop caching until the lost listening connection is reconnected."""
+        import asyncio
+
+        log.warning(f"Lost the listening connection of {self!r}, invalidating all cached results until reconnected.")
+        self.listener = None
+        self._listener_lost = True
+        self._invalidate()
+        if self._relisten_task is None:
+            self._relisten_task = asyncio.ensure_future(self._relisten(self._listen_channel))
+
+    @staticmethod
+    def _table_names(tables: Tables) -> t.Optional[t.FrozenSet[str]]:
+        return None if tables is None else frozenset(str(tbl) for tbl in tables)
+
+    def _invalidate(self, tables: Tables = None):
+        """
+        Remove cached results read from the given tables, or all cached results if tables aren't known.
+
+        Running queries reading from the tables are also no longer shared, as they may have started before the write.
+        """
+        names = self._table_names(tables)
+        for key, (_, read) in list(self._in_flight.items()):
+            if names is None or read is None or not names.isdisjoint(read):
+                del self._in_flight[key]
+        if self.cache is None:
+            return
+        self.cache.invalidate(names)
+        pending = self._pending_invalidation.get()
+        if pending is not None:
+            pending.append(names)
+
+    async def _query(
+        self,
+        method: str,
+        sql: str,
+        args: tuple,
+        query: t.Callable[[], t.Awaitable],
+        *options: t.Any,
+        tables: Tables,
+        readonly: bool,
+    ) -> t.Any:
+        """
+        Run a query, using the result cache if it's a read-only query of known tables.
+
+        Queries that aren't read-only invalidate cached results of the given tables, or all results if not given.
+        Identical read-only queries running at the same time share a single execution if coalescing is enabled.
+        Queries within a transaction never use the cache or coalescing, as they may see uncommitted writes.
+        """
+        cache = self.cache
+        coalesce = self._coalesce and not self._primary_reads.get()
+        if not readonly:
+            if cache is None and not self._coalesce:
+                return await query()
+            try:
+                return await query()
+            finally:
+                self._invalidate(tables)
+
+        if cache is None and not coalesce:
+            return await query()
+        if self._connection.get() is not None or self._pending_invalidation.get() is not None:
+            return await query()
+        key = ResultCache.key(method, sql, args, *options)
+        if key is None:
+            return await query()
+
+        # an empty set of tables means the tables read aren't known, such as with raw SQL columns
+        names = self._table_names(tables) or None
+        cached = cache is not None and names is not None and not self._listener_lost
+        if cached and self.replicas and not self._primary_reads.get():
+            cached = not cache.lagging(names)
+        result = cache.get(key, _MISSING) if cached else _MISSING
+        if result is _MISSING:
+            generation = cache.generation if cached else None
+            result = await self._single_flight(key, query, names) if coalesce else await query()
+            if cached:
+                cache.set(key, result, names, generation=generation)
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: t.Any) -> t.Any:
+        """Copy a cached or shared result, so callers changing their rows don't change those of other callers."""
+        if isinstance(result, Record):
+            return result.copy()
+        if isinstance(result, list):
+            return [row.copy() if isinstance(row, Record) else row for row in result]
+        return result
+
+    async def _single_flight(self, key: t.Hashable, query: t.Callable[[], t.Awaitable], tables: Tables) -> t.Any:
+        """Run a query, or wait for the result of an identical query already running."""
+        import asyncio
+
+        entry = self._in_flight.get(key)
+        if entry is not None:
+            future = entry[0]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # the query being waited on was cancelled, so run it again
+            return await self._single_flight(key, query, tables)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = self._in_flight[key] = (future, self._table_names(tables))
+        try:
+            result = await query()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved by any waiting queries, so don't warn if there aren't any
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is entry:
+                del self._in_flight[key]
+
+    def _mock_execute(self, sql: str, args: tuple) -> t.Union[str, tuple[str, t.Any]]:
+        """Track the statement and return it as the result when execution is disabled."""
+        if self.metrics is not None:
+            self.metrics.record(sql, 0.0)
+        try:
+            stmt_list = self._tracking.get()
+            stmt_list.append((sql, args))
+        except LookupError:
+            pass
+        if not args:
+            return sql
+        else:
+            return sql, *args
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self, readonly: bool = False) -> t.AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection to run a query on, using the pinned connection if any."""
+        executor = await self._executor(readonly)
+        if not hasattr(executor, "acquire"):
+            yield executor
+            return
+        # asyncpg 0.23 pools don't report their idle connections, so count acquired connections for least_busy
+        self._acquired[executor] = self._acquired.get(executor, 0) + 1
+        try:
+            async with executor.acquire() as conn:
+                yield conn
+        finally:
+            self._acquired[executor] -= 1
+            if not self._acquired[executor]:
+                del self._acquired[executor]
+
+    async def _run(
+        self,
+        method: str,
+        *args,
+        statement: str,
+        readonly: bool = False,
+        **kwargs,
+    ) -> t.Any:
+        """Call a query method on an acquired connection, recording the statement if instrumentation is enabled."""
+        start = time.perf_counter()
+        acquired = None
+        result = None
+        error = False
+        try:
+            async with self._acquire(readonly) as conn:
+                acquired = time.perf_counter()
+                result = await getattr(conn, method)(*args, **kwargs)
+            return result
+        except Exception:
+            error = True
+            raise
+        finally:
+            if self.metrics is not None:
+                end = time.perf_counter()
+                acquired = acquired or end
+                rows = self._row_count(method, result)
+                self.metrics.record(statement, end - acquired, rows=rows, acquire=acquired - start, error=error)
+
+    @staticmethod
+    def _row_count(method: str, result: t.Any) -> int:
+        """Return the number of rows returned or affected by a query method's result."""
+        if method in ("fetch", "fetchmany"):
+            return len(result) if result else 0
+        if method in ("fetchrow", "fetchval"):
+            return int(result is not None)
+        count = str(result or "").rpartition(" ")[2]
+        return int(count) if count.isdigit() else 0
+
+    async def execute(
+        self,
+        sql: str,
+        *args,
+        tables: Tables = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.Union[str, tuple[str, t.Any]]:
+        """
+        Execute an SQL statement.
+
+        Cached results of the tables it writes to are invalidated, or all cached results if they aren't given.
+        """
+        async def query() -> t.Any:
+            if self._mock:
+                return self._mock_execute(sql, args)
+            return await self._run("execute", sql, *args, statement=sql, timeout=timeout)
+
+        return await self._query("execute", sql, args, query, tables=tables, readonly=False)
+
+    async def fetch(
+        self,
+        sql: str,
+        *args,
+        readonly: bool = False,
+        into: t.Optional[t.Type[Record]] = None,
+        tables: Tables = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.List[t.Union[asyncpg.Record, Record]]:
+        """
+        Execute an SQL statement, returning all resulting rows, as instances of a Record class if given.
+
+        Results of read-only statements are cached if the result cache is enabled and the tables read are given.
+        """
+        async def query() -> t.Any:
+            if self._mock:
+                return self._mock_execute(sql, args)
+            rows = await self._run("fetch", sql, *args, statement=sql, readonly=readonly, timeout=timeout)
+            return [into.from_row(row) for row in rows] if into else rows
+
+        return await self._query("fetch", sql, args, query, into, tables=tables, readonly=readonly)
+
+    async def fetchrow(
+        self,
+        sql: str,
+        *args,
+        readonly: bool = False,
+        into: t.Optional[t.Type[Record]] = None,
+        tables: Tables = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.Optional[t.Union[asyncpg.Record, Record]]:
+        """Execute an SQL statement, returning the first resulting row, as an instance of a Record class if given."""
+        async def query() -> t.Any:
+            if self._mock:
+                return self._mock_execute(sql, args)
+            row = await self._run("fetchrow", sql, *args, statement=sql, readonly=readonly, timeout=timeout)
+            return into.from_row(row) if into and row is not None else row
+
+        return await self._query("fetchrow", sql, args, query, into, tables=tables, readonly=readonly)
+
+    async def fetchval(
+        self,
+        sql: str,
+        *args,
+        readonly: bool = False,
+        column: int = 0,
+        tables: Tables = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.Any:
+        """Execute an SQL statement, returning a value from the first resulting row."""
+        async def query() -> t.Any:
+            if self._mock:
+                return self._mock_execute(sql, args)
+            return await self._run(
+                "fetchval", sql, *args, statement=sql, readonly=readonly, column=column, timeout=timeout
+            )
+
+        return await self._query("fetchval", sql, args, query, column, tables=tables, readonly=readonly)
+
+    async def stream(
+        self,
+        sql: str,
+        *args,
+        batch: int = 100,
+        chunked: bool = False,
+        readonly: bool = False,
+        into: t.Optional[t.Type[Record]] = None,
+        timeout: t.Optional[float] = None,
+    ) -> t.AsyncIterator[t.Union[asyncpg.Record, Record, t.List[t.Union[asyncpg.Record, Record]]]]:
+        """
+        Execute an SQL statement, yielding resulting rows from a server-side cursor.
+
+        Rows are fetched from the cursor `batch` at a time, so only a single batch is held in memory.
+        Each batch is yielded as a list instead of row by row when `chunked` is set, and rows are decoded as instances
+        of a Record class if given.
+        """
+        if batch < 1:
+            raise QueryError("Stream batch size must be at least 1.")
+
+        if self._mock:
+            yield self._mock_execute(sql, args)
+            return
+
+        start = time.perf_counter()
+        acquired = None
+        count = 0
+        error = False
+        try:
+            async with self._acquire(readonly) as conn:
+                acquired = time.perf_counter()
+                async for rows in self._cursor(conn, sql, args, batch, chunked, into, timeout):
+                    count += len(rows) if chunked else 1
+                    yield rows
+        except Exception:
+            error = True
+            raise
+        finally:
+            if self.metrics is not None:
+                end = time.perf_counter()
+                acquired = acquired or end
+                self.metrics.record(sql, end - acquired, rows=count, acquire=acquired - start, error=error)
+
+    async def fetch_columns(
+        self,
+        sql: str,
+        *args,
+        columns: t.Mapping[str, t.Optional[str]],
+        batch: int = 10000,
+        numpy: t.Optional[bool] = None,
+        readonly: bool = False,
+        timeout: t.Optional[float] = None,
+    ) -> t.Dict[str, t.Any]:
+        """
+        Execute an SQL statement, returning one contiguous buffer per resulting column instead of rows.
+
+        Columns map each resulting column name to an array typecode, with values stored in an array.array, or a
+        NumPy array if available, when given one. Rows are streamed in batches, so they're never all held at once.
+        """
+        if self._mock:
+            return self._mock_execute(sql, args)
+
+        bufs = columnar.buffers(columns.values())
+        async for rows in self.stream(sql, *args, batch=batch, chunked=True, readonly=readonly, timeout=timeout):
+            columnar.extend(bufs, rows)
+        return dict(zip(columns, columnar.finalise(bufs, numpy)))
+
+    @staticmethod
+    async def _cursor(
+        conn: asyncpg.Connection,
+        sql: str,
+        args: tuple,
+        batch: int,
+        chunked: bool,
+        into: t.Optional[t.Type[Record]],
+        timeout: t.Optional[float],
+    ) -> t.AsyncIterator[t.Union[asyncpg.Record, Record, t.List[t.Union[asyncpg.Record, Record]]]]:
+        """Yield rows from a cursor opened on the given connection, within a transaction or savepoint."""
+        async with conn.transaction():
+            cursor = await conn.cursor(sql, *args, timeout=timeout)
+            while rows := await cursor.fetch(batch, timeout=timeout):
+                if into:
+                    rows = [into.from_row(row) for row in rows]
+                if chunked:
+                    yield rows
+                else:
+                    for row in rows:
+                        yield row
+
+    async def copy_records(
+        self,
+        table_name: str,
+        records: t.Union[t.Iterable[t.Sequence], t.AsyncIterable[t.Sequence]],
+        *,
+        columns: t.Sequence[str],
+        schema_name: str = "public",
+        timeout: t.Optional[float] = None,
+    ) -> str:
+        """
+        Load records into a table with the binary COPY protocol.
+
+        Records of an async iterable are copied in batches of COPY_BATCH_SIZE within a single transaction, as asyncpg
+        only copies from async iterables since 0.24.
+        """
+        statement = f"COPY {schema_name}.{table_name} ({', '.join(columns)}) FROM STDIN (FORMAT binary);"
+
+        async def copy(batch: t.List[t.Sequence]) -> str:  # pragma: no cover
+            return await self._run(
+                "copy_records_to_table",
+                table_name,
+                statement=statement,
+                records=batch,
+                columns=columns,
+                schema_name=schema_name,
+                timeout=timeout,
+            )
+
+        async def query() -> t.Any:
+            if self._mock:
+                return self._mock_execute(statement, ())
+            if not hasattr(records, "__aiter__"):  # pragma: no cover
+                return await copy(records)
+            count = 0  # pragma: no cover
+            async with self.transaction():  # pragma: no cover
+                async for batch in batches(records, COPY_BATCH_SIZE):
+                    count += self._row_count("copy_records_to_table", await copy(batch))
+            return f"COPY {count}"  # pragma: no cover
+
+        tables = [f"{schema_name}.{table_name}"]
+        return await self._query("copy_records_to_table", statement, (), query, tables=tables, readonly=False)
 
     def Schema(self, name: str) -> Schema:
         """Return a bound Schema for this database."""
@@ -152,6 +923,11 @@ class Database(LimitInstances):
         self.schemas.add(s)
         return s
 
+    def remove_schema(self, schema: t.Union[Schema, str]):
+        """Stop preparing a schema and it's tables with this database, allowing it to be freed once unused."""
+        name = str(schema)
+        self.schemas = {s for s in self.schemas if s.name != name}
+
     def Table(self, name: str) -> Table:
         """Return a bound Table for the public schema on this database."""
         return Table(name, self)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import typing as t
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_MAX_STATEMENTS = 1000
+OVERFLOW_STATEMENT = "other"
+
+_LITERAL = re.compile(r"(\"(?:[^\"]|\"\")*\")|'(?:[^']|'')*'|(?<![\w$.])\d+(?:\.\d+)?(?![\w.])")
+_IN_LIST = re.compile(r"\bIN \((?:\$\d+|\?)(?:, ?(?:\$\d+|\?))*\)", re.IGNORECASE)
+
+
+class StatementStats:
+    """Counters and a latency histogram for a single normalised statement."""
+
+    __slots__ = ("statement", "buckets", "bucket_counts", "count", "errors", "rows", "total_time", "acquire_time")
+
+    def __init__(self, statement: str, buckets: t.Sequence[float] = DEFAULT_BUCKETS):
+        self.statement = statement
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.acquire_time = 0.0
+
+    def __repr__(self):
+        return f"<StatementStats '{self.statement}' count={self.count} errors={self.errors}>"
+
+    def observe(self, duration: float, *, rows: int = 0, acquire: float = 0.0, error: bool = False):
+        """Record a single execution of the statement."""
+        self.count += 1
+        self.errors += error
+        self.rows += rows
+        self.total_time += duration
+        self.acquire_time += acquire
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """Return the current values as a dictionary."""
+        cumulative = 0
+        histogram = dict()
+        for bound, count in zip((*self.buckets, float("inf")), self.bucket_counts):
+            cumulative += count
+            histogram[bound] = cumulative
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_time": self.total_time,
+            "acquire_time": self.acquire_time,
+            "histogram": histogram,
+        }
+
+
+class Metrics:
+    """
+    Per-statement execution metrics collected by a Database.
+
+    Up to `max_statements` distinct statements are tracked, with executions of any others recorded together under
+    OVERFLOW_STATEMENT.
+    """
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS, max_statements: int = DEFAULT_MAX_STATEMENTS):
+        self.buckets = tuple(sorted(buckets))
+        self.max_statements = max_statements
+        self._stats: t.Dict[str, StatementStats] = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Metrics statements={len(self._stats)}>"
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __getitem__(self, sql: str) -> StatementStats:
+        return self._stats[self.normalise(sql)]
+
+    @staticmethod
+    def normalise(sql: str) -> str:
+        """
+        Replace literals with placeholders and collapse whitespace, so equivalent statements are recorded together.
+
+        Lists of values within IN are collapsed regardless of their length.
+        """
+        sql = _LITERAL.sub(lambda m: m.group(1) or "?", sql)
+        sql = " ".join(sql.split())
+        return _IN_LIST.sub("IN (...)", sql)
+
+    def record(self, sql: str, duration: float, *, rows: int = 0, acquire: float = 0.0, error: bool = False):
+        """Record a single execution of a statement."""
+        statement = self.normalise(sql)
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    statement = OVERFLOW_STATEMENT
+                    stats = self._stats.get(statement)
+                if stats is None:
+                    self._stats[statement] = stats = StatementStats(statement, self.buckets)
+            stats.observe(duration, rows=rows, acquire=acquire, error=error)
+
+    def reset(self):
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """Return the current values of all statements, keyed by normalised statement."""
+        with self._lock:
+            return {statement: stats.snapshot() for statement, stats in self._stats.items()}
+
+    def prometheus(self, prefix: str = "everstone") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name: str, kind: str, description: str):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def label(statement: str, **extra: str) -> str:
+            value = statement.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+            extras = "".join(f',{k}="{v}"' for k, v in extra.items())
+            return f'{{statement="{value}"{extras}}}'
+
+        family("statement_duration_seconds", "histogram", "Time spent executing statements.")
+        for statement, stats in snapshot.items():
+            for bound, count in stats["histogram"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{prefix}_statement_duration_seconds_bucket{label(statement, le=le)} {count}")
+            lines.append(f"{prefix}_statement_duration_seconds_sum{label(statement)} {stats['total_time']!r}")
+            lines.append(f"{prefix}_statement_duration_seconds_count{label(statement)} {stats['count']}")
+
+        for name, key, description in (
+            ("statement_errors_total", "errors", "Statement executions that raised an error."),
+            ("statement_rows_total", "rows", "Rows returned or affected by statements."),
+            ("statement_acquire_seconds_total", "acquire_time", "Time spent waiting to acquire a pool connection."),
+        ):
+            family(name, "counter", description)
+            for statement, stats in snapshot.items():
+                lines.append(f"{prefix}_{name}{label(statement)} {stats[key]!r}")
+
+        return "\n".join(lines) + "\n"
@@ -1,4 +1,5 @@
 from .column import Column
 from .constraints import Constraint
+from .loader import Loader
 from .schema import Schema
 from .table import Table
@@ -11,6 +11,8 @@ if t.TYPE_CHECKING:
 class Aggregate(comparisons.Comparable):
     """Represents an aggregate SQL function."""
 
+    __slots__ = ("column", "alias", "_distinct")
+
     name: str
 
     def __init__(self, column: t.Optional[Column, str]):
@@ -30,6 +32,11 @@ class Aggregate(comparisons.Comparable):
         self._distinct = True
         return self
 
+    @property
+    def table(self) -> t.Optional[table.Table]:
+        """Table of the aggregated column, if it's bound to one."""
+        return getattr(self.column, "table", None)
+
     def as_(self, alias: str) -> sql:
         """Sets an alias name to represent the result of the aggregate function."""
         definition = self.sql
@@ -46,45 +53,64 @@ class Aggregate(comparisons.Comparable):
 class Avg(Aggregate):
     """Computes the average of all non-null input values."""
 
+    __slots__ = ()
+
     name = "avg"
 
 
 class BitAnd(Aggregate):
     """Computes the bitwise AND of all non-null input values."""
 
+    __slots__ = ()
+
     name = "bit_and"
 
 
 class BitOr(Aggregate):
     """Computes the bitwise OR of all non-null input values."""
 
+    __slots__ = ()
+
     name = "bit_or"
 
 
 class BoolAnd(Aggregate):
     """Returns TRUE if all non-null input values are TRUE, otherwise FALSE."""
 
+    __slots__ = ()
+
     name = "bool_and"
 
 
 class BoolOr(Aggregate):
     """Returns TRUE if any non-null input value is TRUE, otherwise FALSE."""
 
+    __slots__ = ()
+
     name = "bool_or"
 
 
 class Count(Aggregate):
     """Computes the number of input rows, counting only non-nulls if a column is specified."""
 
+    __slots__ = ("_table",)
+
     name = "count"
 
     def __init__(self, value: t.Optional[Column, table.Table, str] = None):
+        self._table = None
         if not value:
             super().__init__("*")
         elif isinstance(value, table.Table):
-            super().__init__(f"{value}.*" if value else "*")
+            self._table = value
+            super().__init__(f"{value}.*")
         else:
-            super().__init__(f"{value}")
+            super().__init__(value)
+
+    @property
+    def table(self) -> t.Optional[table.Table]:
+        """Table being counted, if bound to one."""
+        return self._table or super().table
 
     @classmethod
     def all(cls) -> Count:
@@ -95,16 +121,22 @@ class Count(Aggregate):
 class Max(Aggregate):
     """Computes the maximum of the non-null input values."""
 
+    __slots__ = ()
+
     name = "max"
 
 
 class Min(Aggregate):
     """Computes the minimum of the non-null input values."""
 
+    __slots__ = ()
+
     name = "min"
 
 
 class Sum(Aggregate):
     """Computes the sum of the non-null input values."""
 
+    __slots__ = ()
+
     name = "sum"
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+import typing as t
+
+from .constraints import NamedConstraint
+from .table import dependency_order
+
+if t.TYPE_CHECKING:
+    from .schema import Schema
+
+CATALOG_QUERY = """
+SELECT 'schema' AS kind, n.nspname AS schema_name, NULL AS table_name, NULL AS name, NULL AS detail
+FROM pg_catalog.pg_namespace n
+WHERE n.nspname = ANY($1::text[])
+UNION ALL
+SELECT 'table', n.nspname, c.relname, NULL, NULL
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p') AND n.nspname = ANY($1::text[])
+UNION ALL
+SELECT 'column', n.nspname, c.relname, a.attname, pg_catalog.format_type(a.atttypid, a.atttypmod)
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p') AND a.attnum > 0 AND NOT a.attisdropped AND n.nspname = ANY($1::text[])
+UNION ALL
+SELECT 'constraint', n.nspname, c.relname, con.conname, pg_catalog.pg_get_constraintdef(con.oid)
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = ANY($1::text[]);
+""".strip()
+
+_CATALOG_TYPES = {
+    "SMALLINT": "smallint",
+    "INTEGER": "integer",
+    "BIGINT": "bigint",
+    "SMALLSERIAL": "smallint",
+    "SERIAL": "integer",
+    "BIGSERIAL": "bigint",
+    "NUMERIC": "numeric",
+    "DECIMAL": "numeric",
+    "REAL": "real",
+    "DOUBLE PRECISION": "double precision",
+    "MONEY": "money",
+    "TEXT": "text",
+    "VARCHAR": "character varying",
+    "CHARACTER VARYING": "character varying",
+    "CHAR": "character",
+    "CHARACTER": "character",
+    "BPCHAR": "character",
+    "BYTEA": "bytea",
+    "TIMESTAMP": "timestamp without time zone",
+    "TIMESTAMP WITH TIME ZONE": "timestamp with time zone",
+    "DATE": "date",
+    "TIME": "time without time zone",
+    "INTERVAL": "interval",
+    "BOOLEAN": "boolean",
+    "JSON": "json",
+    "JSONB": "jsonb",
+}
+
+
+def catalog_type(sql: str) -> str:
+    """Convert an SQL type into the form reported by the PostgreSQL catalog's format_type."""
+    sql = " ".join(sql.upper().split())
+    base, dims = re.fullmatch(r"(.*?)((?:\[\d*])*)", sql).groups()
+    modifier = re.search(r"\(([^)]*)\)", base)
+    if modifier:
+        base = " ".join(base.replace(modifier.group(0), "").split())
+    name = _CATALOG_TYPES.get(base, base.lower())
+    if name == "character" and not modifier:
+        name = "character(1)"
+    elif modifier:
+        mod = modifier.group(1).replace(" ", "")
+        head, _, tail = name.partition(" ")
+        # only time types are reported with their precision before the time zone
+        name = f"{head}({mod}) {tail}" if tail and head.startswith("time") else f"{name}({mod})"
+    return f"{name}[]" if dims else name
+
+
+class CatalogDiff:
+    """Statements needed to bring a database in line with declared schemas, and any drift found."""
+
+    def __init__(self):
+        self.schemas: t.List[str] = []
+        self.tables: t.List[t.List[str]] = []
+        self.alterations: t.List[str] = []
+        self.drift: t.List[str] = []
+
+    def __bool__(self):
+        return bool(self.statements)
+
+    def __repr__(self):
+        return f"<CatalogDiff statements={len(self.statements)} drift={len(self.drift)}>"
+
+    @property
+    def statements(self) -> t.List[str]:
+        """All statements to execute, in dependency order."""
+        return [*self.schemas, *(sql for level in self.tables for sql in level), *self.alterations]
+
+
+def diff(schemas: t.Iterable[Schema], rows: t.Iterable[t.Mapping[str, t.Any]]) -> CatalogDiff:
+    """Compare declared schemas against rows from CATALOG_QUERY, returning the missing DDL and drift."""
+    existing_schemas = set()
+    existing_tables = set()
+    existing_columns: t.Dict[t.Tuple[str, str], t.Dict[str, str]] = dict()
+    existing_constraints: t.Dict[t.Tuple[str, str], t.Set[str]] = dict()
+    for row in rows:
+        key = (row["schema_name"], row["table_name"])
+        if row["kind"] == "schema":
+            existing_schemas.add(row["schema_name"])
+        elif row["kind"] == "table":
+            existing_tables.add(key)
+        elif row["kind"] == "column":
+            existing_columns.setdefault(key, dict())[row["name"]] = row["detail"]
+        elif row["kind"] == "constraint":
+            existing_constraints.setdefault(key, set()).add(row["name"])
+
+    result = CatalogDiff()
+    schemas = sorted(schemas, key=lambda s: s.name)
+    result.schemas = [s.create_sql(if_exists=False) for s in schemas if s.name not in existing_schemas]
+
+    missing_tables = []
+    for schema in schemas:
+        for table in sorted(schema.tables, key=lambda tbl: tbl.name):
+            key = (schema.name, table.name)
+            if key not in existing_tables:
+                missing_tables.append(table)
+                continue
+
+            columns = existing_columns.get(key, dict())
+            for col in table.columns:
+                if col.name not in columns:
+                    result.alterations.append(f"ALTER TABLE {table.full_name} ADD COLUMN {col.definition};")
+                elif catalog_type(col.type.sql) != columns[col.name]:
+                    result.drift.append(
+                        f"Column {col.full_name} is {columns[col.name]}, declared as {catalog_type(col.type.sql)}."
+                    )
+            for name in columns.keys() - {col.name for col in table.columns}:
+                result.drift.append(f"Column {table.full_name}.{name} exists but is not declared.")
+
+            constraints = existing_constraints.get(key, set())
+            for con in table.constraints:
+                if isinstance(con, NamedConstraint) and con.name not in constraints:
+                    result.alterations.append(f"ALTER TABLE {table.full_name} ADD {con.sql};")
+
+    for level in dependency_order(missing_tables):
+        result.tables.append([tbl.create_sql(if_not_exists=True, qualified=True) for tbl in level])
+    return result
@@ -18,6 +18,12 @@ class DefaultNotSet:
 class Column(comparisons.Comparable):
     """Reprents an SQL column."""
 
+    __slots__ = ("_name", "type", "constraints", "alias", "table", "_default")
+
+    # query modifiers, only set on views of the column
+    _sort_direction: t.Optional[str] = None
+    _grouped: bool = False
+
     def __init__(self, name: str, type: SQLTypes, *constraints_: Constraints, default=DefaultNotSet):
         self._name = name
         self.type = type
@@ -26,10 +32,6 @@ class Column(comparisons.Comparable):
         self.table: t.Optional[Table] = None
         self._default = default
 
-        # query modifiers
-        self._sort_direction = None
-        self._grouped = False
-
     @property
     def name(self) -> str:
         return self.alias or self._name
@@ -39,13 +41,12 @@ class Column(comparisons.Comparable):
         return self._sort_direction
 
     @property
-    def grouped(self):
-        self._grouped = True
-        return self
+    def grouped(self) -> ColumnView:
+        return ColumnView(self, self.alias, self._sort_direction, True)
 
-    def reset_modifiers(self):
-        self._sort_direction = None
-        self._grouped = False
+    def reset_modifiers(self) -> Column:
+        """Return the column without any sort direction, alias or grouping."""
+        return self
 
     @property
     def default(self) -> t.Any:
@@ -64,6 +65,11 @@ class Column(comparisons.Comparable):
         else:
             return f"{self.full_name} AS {self.alias}"
 
+    @property
+    def cast(self) -> str:
+        """SQL type to cast bound values to when comparing or inserting them for this column."""
+        return getattr(self.type, "cast", None) or self.type.sql
+
     @property
     def full_name(self) -> str:
         """Fully qualified name for the column."""
@@ -79,10 +85,7 @@ class Column(comparisons.Comparable):
 
     def copy(self) -> Column:
         c = Column(self._name, self.type, *self.constraints, default=self._default)
-        c.alias = self.alias
         c.table = self.table
-        c._sort_direction = self._sort_direction
-        c._grouped = self._grouped
         return c
 
     # region: meta
@@ -97,69 +100,124 @@ class Column(comparisons.Comparable):
 
     # region: aggregates
 
+    def _aggregate(self, cls: t.Type[aggregates.Aggregate], suffix: str) -> aggregates.Aggregate:
+        """Return an aggregate of this column, named after the column and aggregate."""
+        aggregate = cls(self)
+        aggregate.alias = f"{self.name}_{suffix}"
+        return aggregate
+
     @property
     def avg(self) -> aggregates.Avg:
         """Average of all non-null values in this column."""
-        return aggregates.Avg(self).as_(f"{self.name}_avg")
+        return self._aggregate(aggregates.Avg, "avg")
 
     @property
     def bit_and(self) -> aggregates.BitAnd:
         """Bitwise AND of all non-null values in this column."""
-        return aggregates.BitAnd(self).as_(f"{self.name}_bit_and")
+        return self._aggregate(aggregates.BitAnd, "bit_and")
 
     @property
     def bit_or(self) -> aggregates.BitOr:
         """Bitwise OR of all non-null values in this column."""
-        return aggregates.BitOr(self).as_(f"{self.name}_bit_or")
+        return self._aggregate(aggregates.BitOr, "bit_or")
 
     @property
     def bool_and(self) -> aggregates.BoolAnd:
         """Returns True if ALL non-null values in this column are True."""
-        return aggregates.BoolAnd(self).as_(f"{self.name}_bool_and")
+        return self._aggregate(aggregates.BoolAnd, "bool_and")
 
     @property
     def bool_or(self) -> aggregates.BoolOr:
         """Returns True if ANY non-null values in this column are True."""
-        return aggregates.BoolOr(self).as_(f"{self.name}_bool_or")
+        return self._aggregate(aggregates.BoolOr, "bool_or")
 
     @property
     def count(self) -> aggregates.Count:
         """Counts of all rows."""
-        return aggregates.Count(self).as_(f"{self.name}_count")
+        return self._aggregate(aggregates.Count, "count")
 
     @property
     def max(self) -> aggregates.Max:
         """Maximum of all non-null values in this column."""
-        return aggregates.Max(self).as_(f"{self.name}_max")
+        return self._aggregate(aggregates.Max, "max")
 
     @property
     def min(self) -> aggregates.Min:
         """Minimum of all non-null values in this column."""
-        return aggregates.Min(self).as_(f"{self.name}_min")
+        return self._aggregate(aggregates.Min, "min")
 
     @property
     def sum(self) -> aggregates.Sum:
         """Sum of all non-null values in this column."""
-        return aggregates.Sum(self).as_(f"{self.name}_sum")
+        return self._aggregate(aggregates.Sum, "sum")
 
     # endregion
 
     # region: query modifiers
 
     @property
-    def asc(self) -> Column:
-        c = self.copy()
-        c._sort_direction = "ASC"
-        return c
+    def asc(self) -> ColumnView:
+        return ColumnView(self, self.alias, "ASC", self._grouped)
 
     @property
-    def desc(self) -> Column:
-        c = self.copy()
-        c._sort_direction = "DESC"
-        return c
+    def desc(self) -> ColumnView:
+        return ColumnView(self, self.alias, "DESC", self._grouped)
 
-    def as_(self, alias: str) -> Column:
+    def as_(self, alias: str) -> ColumnView:
         """Sets an alias name to represent this column and returns it's definition."""
-        c = self.copy()
-        c.alias = alias
-        return c
+        return ColumnView(self, alias, self._sort_direction, self._grouped)
+
+
+class ColumnView(Column):
+    """
+    A column with query modifiers applied.
+
+    Views read the definition of the column they're created from instead of copying it, so they reflect any later
+    changes to it, such as being added to a table. Views are immutable, so creating a view with different modifiers
+    returns a new view rather than changing an existing one.
+    """
+
+    __slots__ = ("column", "_sort_direction", "_grouped")
+
+    def __init__(self, column: Column, alias: t.Optional[str], sort_direction: t.Optional[str], grouped: bool):
+        init = object.__setattr__
+        init(self, "column", column.reset_modifiers())
+        init(self, "alias", alias)
+        init(self, "_sort_direction", sort_direction)
+        init(self, "_grouped", grouped)
+
+    @property
+    def _name(self) -> str:
+        return self.column._name
+
+    @property
+    def type(self) -> SQLTypes:
+        """SQL type of the column."""
+        return self.column.type
+
+    @property
+    def constraints(self) -> t.FrozenSet[Constraints]:
+        """Constraints of the column, which can't be changed through a view."""
+        return frozenset(self.column.constraints)
+
+    @property
+    def table(self) -> t.Optional[Table]:
+        """Table the column belongs to."""
+        return self.column.table
+
+    @property
+    def _default(self) -> t.Any:
+        return self.column._default
+
+    def __setattr__(self, name: str, value: t.Any):
+        raise AttributeError(f"Cannot set '{name}' of an immutable column view.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Cannot delete '{name}' of an immutable column view.")
+
+    def reset_modifiers(self) -> Column:
+        """Return the column without any sort direction, alias or grouping."""
+        return self.column
+
+    def copy(self) -> ColumnView:
+        return ColumnView(self.column, self.alias, self._sort_direction, self._grouped)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import array
+import typing as t
+
+from . import aggregates, types
+
+if t.TYPE_CHECKING:
+    from .column import Column
+
+Buffer = t.Union[array.array, t.List[t.Any]]
+
+# array typecodes for SQL types with a fixed size numeric representation
+_TYPECODES = {
+    types.Boolean: "b",
+    types.SmallInteger: "h",
+    types.Integer: "i",
+    types.BigInteger: "q",
+    types.SmallSerial: "h",
+    types.Serial: "i",
+    types.BigSerial: "q",
+    types.Real: "f",
+    types.DoublePrecision: "d",
+}
+
+
+def typecode(col: t.Union[Column, aggregates.Aggregate, str]) -> t.Optional[str]:
+    """Return the array typecode to store values of a selected column with, if it has a numeric SQL type."""
+    if isinstance(col, aggregates.Count):
+        return "q"
+    if isinstance(col, (aggregates.Max, aggregates.Min)):
+        col = col.column
+    sql_type = getattr(col, "type", None)
+    if sql_type is None:
+        return None
+    return _TYPECODES.get(sql_type if isinstance(sql_type, type) else type(sql_type))
+
+
+def buffers(typecodes: t.Iterable[t.Optional[str]]) -> t.List[Buffer]:
+    """Create an empty buffer for each column, using an array for those with a typecode."""
+    return [array.array(code) if code else [] for code in typecodes]
+
+
+def extend(bufs: t.List[Buffer], rows: t.Sequence[t.Sequence[t.Any]]):
+    """Append a batch of rows to the column buffers, falling back to a list for any column containing NULL."""
+    if not rows:
+        return
+    for i, values in enumerate(zip(*rows)):
+        buf = bufs[i]
+        if isinstance(buf, array.array) and None in values:
+            bufs[i] = buf = buf.tolist()
+        buf.extend(values)
+
+
+def finalise(bufs: t.List[Buffer], numpy: t.Optional[bool] = None) -> t.List[t.Any]:
+    """
+    Return the column buffers, converting arrays to NumPy arrays without copying if requested.
+
+    NumPy is used if it's installed when `numpy` isn't set.
+    """
+    if numpy is False:
+        return bufs
+    try:
+        import numpy as np
+    except ImportError:
+        if numpy:
+            raise
+        return bufs
+    return [
+        (np.frombuffer(buf, dtype="?") if buf.typecode == "b" else np.frombuffer(buf, dtype=buf.typecode))
+        if isinstance(buf, array.array) else buf
+        for buf in bufs
+    ]
@@ -3,136 +3,330 @@ from __future__ import annotations
 import abc
 import typing as t
 
+from .types import SpecialValue
+
+
+def _typed(value: t.Any) -> t.Any:
+    """Pair a bound value with it's type, so equal values of different types such as 1 and True are distinct."""
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_typed(v) for v in value)
+    return type(value), value
+
+
+class Parameter:
+    """Represents a value bound to an SQL statement as a positional argument."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: t.Any):
+        self.value = value
+
+    def __repr__(self):
+        return f"<Parameter {self.value!r}>"
+
+    def compile(self, args: t.Optional[list]) -> str:
+        """Add the value to the given arguments, returning it's placeholder, or inline it if no arguments given."""
+        if args is None:
+            return Comparable._sql_value(self.value)
+        args.append(self.value)
+        return f"${len(args)}"
+
 
 class Condition:
-    def __init__(self, expression: t.Union[str, Condition]):
+    """
+    Represents an SQL condition as a node of an expression tree.
+
+    A plain condition is a sequence of SQL text, bound parameters and nested conditions. Combining conditions builds
+    And, Or and Not nodes without rendering anything, and the whole tree is flattened and rendered in a single pass
+    when compiled.
+    """
+
+    __slots__ = ("expression",)
+
+    def __init__(self, *expression: t.Union[str, Parameter, Condition]):
         self.expression = expression
 
     def __str__(self):
-        return str(self.expression)
+        return self.compile()
 
     def __repr__(self):
-        return f'<Condition "{self.expression}">'
+        return f'<{self.__class__.__name__} "{self}">'
 
     def __eq__(self, other):
+        if isinstance(other, Condition):
+            return self._key() == other._key()
         return str(self) == str(other)
 
+    def __hash__(self):
+        try:
+            return hash(self._key())
+        except TypeError:
+            return hash(repr(self._key()))
+
     def __and__(self, other):
-        return Condition(f"({self} AND {other})")
+        return And(self, other)
 
     def __or__(self, other):
-        return Condition(f"({self} OR {other})")
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    @property
+    def args(self) -> tuple:
+        """Values bound to this condition, in placeholder order."""
+        args = []
+        self.compile(args)
+        return tuple(args)
+
+    def _parts(self) -> t.Sequence[t.Union[str, Parameter, Condition]]:
+        """The parts this node renders as, in order."""
+        return self.expression
+
+    def _tokens(self) -> t.Iterator[t.Union[str, Parameter]]:
+        """Yield the SQL text and parameters of the whole tree in order, without recursion."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Condition):
+                stack.extend(reversed(node._parts()))
+            else:
+                yield node
+
+    def _key(self) -> tuple:
+        """Structural representation of the condition, with nested operators of the same kind merged."""
+        key = []
+        for token in self._tokens():
+            if isinstance(token, Parameter):
+                key.append(("$", _typed(token.value)))
+            elif key and isinstance(key[-1], str):
+                key[-1] += str(token)
+            else:
+                key.append(str(token))
+        return tuple(key)
+
+    def compile(self, args: t.Optional[list] = None) -> str:
+        """
+        Render the condition, binding values to the given arguments list as placeholders.
+
+        Values are rendered inline as literals if no arguments list is given.
+        """
+        return "".join(
+            token.compile(args) if isinstance(token, Parameter) else str(token) for token in self._tokens()
+        )
 
     @classmethod
     def and_(cls, *conditions):  # pragma: no cover
-        joined = " AND ".join(str(c) for c in conditions)
-        return cls(f"({joined})")
+        return And(*conditions)
 
     @classmethod
     def or_(cls, *conditions):  # pragma: no cover
-        joined = " OR ".join(str(c) for c in conditions)
-        return cls(f"({joined})")
+        return Or(*conditions)
 
     def and_(self, *conditions):
-        joined = " AND ".join(str(c) for c in [self, *conditions])
-        return Condition(f"({joined})")
+        return And(self, *conditions)
 
     def or_(self, *conditions):
-        joined = " OR ".join(str(c) for c in [self, *conditions])
-        return Condition(f"({joined})")
+        return Or(self, *conditions)
+
+
+class BooleanOperator(Condition):
+    """Base class for conditions joining other conditions with a boolean operator."""
+
+    __slots__ = ("operands",)
+
+    operator: str
+
+    def __init__(self, *operands: t.Union[str, Condition]):
+        super().__init__()
+        self.operands = tuple(op if isinstance(op, Condition) else Condition(op) for op in operands)
+
+    @property
+    def terms(self) -> t.Tuple[Condition, ...]:
+        """Operands of this node, with nested nodes of the same operator merged into it."""
+        terms = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if type(node) is type(self):
+                stack.extend(reversed(node.operands))
+            else:
+                terms.append(node)
+        return tuple(terms)
+
+    def _parts(self) -> t.Sequence[t.Union[str, Condition]]:
+        parts = ["("]
+        for i, term in enumerate(self.terms):
+            if i:
+                parts.append(self.operator)
+            parts.append(term)
+        parts.append(")")
+        return parts
+
+
+class And(BooleanOperator):
+    """Represents conditions that must all be true."""
+
+    __slots__ = ()
+
+    operator = " AND "
+
+
+class Or(BooleanOperator):
+    """Represents conditions where any must be true."""
+
+    __slots__ = ()
+
+    operator = " OR "
+
+
+class Not(Condition):
+    """Represents the negation of a condition."""
+
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: t.Union[str, Condition]):
+        super().__init__()
+        self.operand = operand if isinstance(operand, Condition) else Condition(operand)
+
+    def __invert__(self):
+        return self.operand
+
+    def _parts(self) -> t.Sequence[t.Union[str, Condition]]:
+        if isinstance(self.operand, BooleanOperator):
+            return "NOT ", self.operand
+        return "NOT (", self.operand, ")"
 
 
 class Comparable(metaclass=abc.ABCMeta):
     """Base class to define an SQL object as able to use SQL comparison operations."""
 
+    __slots__ = ()
+
     @staticmethod
     def _sql_value(value: t.Any) -> str:
         """Adjusts a given value into an appropriate representation for SQL statements."""
         if value is None:
             return "NULL"
         elif isinstance(value, str):
+            value = value.replace("'", "''")
             return f"'{value}'"
         elif isinstance(value, bool):
             return "TRUE" if value else "FALSE"
+        elif isinstance(value, (list, tuple)):
+            items = ", ".join(Comparable._sql_value(v) for v in value)
+            return f"ARRAY[{items}]"
         else:
             return f"{value}"
 
+    @staticmethod
+    def _param(value: t.Any) -> t.Union[str, Parameter]:
+        """Adjusts a given value into a bound parameter, unless it's an SQL object or special value."""
+        if isinstance(value, (Comparable, SpecialValue)):
+            return str(value)
+        return Parameter(value)
+
     def __hash__(self):
         return hash(str(self))
 
     def __lt__(self, value: t.Any) -> Condition:
         """Evaluate if less than a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} < {value}")
+        return Condition(str(self), " < ", self._param(value))
 
     def __le__(self, value: t.Any) -> Condition:
         """Evaluate if less than or equal to a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} <= {value}")
+        return Condition(str(self), " <= ", self._param(value))
 
     def __eq__(self, value: t.Any) -> Condition:
         """Evaluate if equal to a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} = {value}")
+        return Condition(str(self), " = ", self._param(value))
 
     def __ne__(self, value: t.Any) -> Condition:
         """Evaluate if not equal to a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} <> {value}")
+        return Condition(str(self), " <> ", self._param(value))
 
     def __gt__(self, value: t.Any) -> Condition:
         """Evaluate if greater than a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} > {value}")
+        return Condition(str(self), " > ", self._param(value))
 
     def __ge__(self, value: t.Any) -> Condition:
         """Evaluate if greater than or equal to a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} >= {value}")
+        return Condition(str(self), " >= ", self._param(value))
 
     def like(self, value: t.Any) -> Condition:
         """Evaluate if like a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} LIKE {value}")
+        return Condition(str(self), " LIKE ", self._param(value))
 
     def not_like(self, value: t.Any) -> Condition:
         """Evaluate if not like a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} NOT LIKE {value}")
+        return Condition(str(self), " NOT LIKE ", self._param(value))
 
     def ilike(self, value: t.Any) -> Condition:
         """Evaluate if like a value, ignoring case."""
-        value = self._sql_value(value)
-        return Condition(f"{self} ILIKE {value}")
+        return Condition(str(self), " ILIKE ", self._param(value))
 
     def not_ilike(self, value: t.Any) -> Condition:
         """Evaluate if not like a value, ignoring case."""
-        value = self._sql_value(value)
-        return Condition(f"{self} NOT ILIKE {value}")
+        return Condition(str(self), " NOT ILIKE ", self._param(value))
 
     def between(self, minvalue: t.Any, maxvalue: t.Any) -> Condition:
         """Evaluate if between two values."""
-        minvalue = self._sql_value(minvalue)
-        maxvalue = self._sql_value(maxvalue)
-        return Condition(f"{self} BETWEEN {minvalue} AND {maxvalue}")
+        return Condition(str(self), " BETWEEN ", self._param(minvalue), " AND ", self._param(maxvalue))
 
     def not_between(self, minvalue: t.Any, maxvalue: t.Any) -> Condition:
         """Evaluate if not between two values."""
-        minvalue = self._sql_value(minvalue)
-        maxvalue = self._sql_value(maxvalue)
-        return Condition(f"{self} NOT BETWEEN {minvalue} AND {maxvalue}")
+        return Condition(str(self), " NOT BETWEEN ", self._param(minvalue), " AND ", self._param(maxvalue))
 
     def is_(self, value: t.Any) -> Condition:
         """Evaluate if is a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} IS {value}")
+        value = self._sql_value(value) if value is None or isinstance(value, bool) else self._param(value)
+        return Condition(str(self), " IS ", value)
 
     def is_not(self, value: t.Any) -> Condition:
         """Evaluate if is not a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} IS NOT {value}")
+        value = self._sql_value(value) if value is None or isinstance(value, bool) else self._param(value)
+        return Condition(str(self), " IS NOT ", value)
+
+    def in_(self, value: t.Any, *, as_array: bool = False) -> Condition:
+        """
+        Evaluate if in a value, binding each item of a collection separately.
+
+        If `as_array` is set, the collection is bound as a single array parameter using `= ANY`, so the statement is
+        the same regardless of how many items it has.
+        """
+        if as_array:
+            return self._array_comparison(" = ANY(", value)
+        return self._in_list(" IN (", value)
+
+    def not_in(self, value: t.Any, *, as_array: bool = False) -> Condition:
+        """
+        Evaluate if not in a value, binding each item of a collection separately.
+
+        If `as_array` is set, the collection is bound as a single array parameter using `<> ALL`, so the statement is
+        the same regardless of how many items it has. Empty collections are always bound as an array, as `NOT IN
+        (NULL)` never matches.
+        """
+        if not isinstance(value, (str, bytes)) and isinstance(value, t.Iterable):
+            value = list(value)
+            as_array = as_array or not value
+        if as_array:
+            return self._array_comparison(" <> ALL(", value)
+        return self._in_list(" NOT IN (", value)
+
+    def _in_list(self, operator: str, value: t.Any) -> Condition:
+        if isinstance(value, (str, bytes)) or not isinstance(value, t.Iterable):
+            value = [value]
+        values = [self._param(v) for v in value] or ["NULL"]
+        parts = [str(self), operator]
+        for i, v in enumerate(values):
+            if i:
+                parts.append(", ")
+            parts.append(v)
+        return Condition(*parts, ")")
 
-    def in_(self, value: t.Any) -> Condition:
-        """Evaluate if in a value."""
-        value = self._sql_value(value)
-        return Condition(f"{self} IN {value}")
+    def _array_comparison(self, operator: str, value: t.Any) -> Condition:
+        if isinstance(value, (str, bytes)) or not isinstance(value, t.Iterable):
+            value = [value]
+        cast = getattr(self, "cast", None)
+        cast = f"::{cast}[]" if cast else ""
+        return Condition(str(self), operator, Parameter(list(value)), f"{cast})")
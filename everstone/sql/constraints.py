@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import typing as t
 
 from .column import Column
@@ -29,23 +30,24 @@ class ConstraintMeta(abc.ABCMeta):
     def __hash__(self):
         return hash(repr(self))
 
-    def named(cls, name: str) -> NamedConstraint:
-        """Returns this constraint as a named constraint."""
-        return NamedConstraint(cls, name)
 
-    def columns(cls, *columns: Column) -> CompositeConstraint:
-        """Returns this constraint as a composite constraint, using multiple columns."""
-        return CompositeConstraint(cls, *columns)
+class hybridmethod:
+    """Method bound to the instance when accessed from one, or to the class otherwise."""
+
+    def __init__(self, func: t.Callable):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance: t.Any, owner: type) -> t.Callable:
+        return functools.partial(self.func, owner if instance is None else instance)
 
 
 class Constraint(metaclass=ConstraintMeta):
     """Base class representing an SQL constraint."""
 
-    sql: str
+    __slots__ = ()
 
-    def __init__(self):
-        self.named = self._named
-        self.columns = self._columns
+    sql: str
 
     def __repr__(self):
         return f'<{self.__class__.__name__} sql="{getattr(self, "sql", None)}">'
@@ -61,20 +63,23 @@ class Constraint(metaclass=ConstraintMeta):
     def __hash__(self):
         return hash(repr(self))
 
-    def _named(self, name: str) -> NamedConstraint:
-        """Instance-specific implementation of Constraint.named."""
+    @hybridmethod
+    def named(self, name: str) -> NamedConstraint:
+        """Returns this constraint as a named constraint."""
         return NamedConstraint(self, name)
 
-    def _columns(self, *columns: Column) -> CompositeConstraint:
-        """Instance-specific implementation of Constraint.columns."""
+    @hybridmethod
+    def columns(self, *columns: Column) -> CompositeConstraint:
+        """Returns this constraint as a composite constraint, using multiple columns."""
         return CompositeConstraint(self, *columns)
 
 
 class NamedConstraint(Constraint):
     """Composite class representing a named SQL constraint."""
 
+    __slots__ = ("constraint", "name", "sql")
+
     def __init__(self, constraint: t.Union[Constraint, ConstraintMeta], name: str):
-        self.columns = self._columns
         self.constraint = constraint
         self.name = name
         self.sql = f"CONSTRAINT {self.name} {self.constraint}"
@@ -83,8 +88,9 @@ class NamedConstraint(Constraint):
 class CompositeConstraint(Constraint):
     """Composite class representing an SQL constraint that uses more than one column."""
 
+    __slots__ = ("constraint", "columns", "sql")
+
     def __init__(self, constraint: t.Union[Constraint, ConstraintMeta], *columns: t.Union[Column, str]):
-        self.named = self._named
         self.constraint = constraint
         self.columns = columns
         cols = ", ".join(getattr(c, "name", c) for c in columns)
@@ -94,10 +100,9 @@ class CompositeConstraint(Constraint):
 class Check(Constraint):
     """Represents a CHECK SQL constraint."""
 
-    sql: str
+    __slots__ = ("name", "expression", "sql")
 
     def __init__(self, expression: str, *, name: t.Optional[str] = None):
-        super().__init__()
         self.name = name
         self.expression = expression
         if name:
@@ -109,25 +114,31 @@ class Check(Constraint):
 class NotNull(Constraint):
     """Represents a NOT NULL SQL constraint."""
 
+    __slots__ = ()
+
     sql = "NOT NULL"
 
 
 class Unique(Constraint):
     """Represents a UNIQUE SQL constraint."""
 
+    __slots__ = ()
+
     sql = "UNIQUE"
 
 
 class PrimaryKey(Constraint):
     """Represents a PRIMARY KEY SQL constraint."""
 
+    __slots__ = ()
+
     sql = "PRIMARY KEY"
 
 
 class ForeignKey(Constraint):
     """Represents a foreign key SQL constraint using REFERENCES."""
 
-    sql: str
+    __slots__ = ("table", "column", "sql")
 
     def __init__(self, column: t.Union[Column, str], *, table: t.Union[Table, str, None] = None):
         if column.table:
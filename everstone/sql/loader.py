@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import contextvars
+import typing as t
+
+from ..exceptions import QueryError, SchemaError
+
+if t.TYPE_CHECKING:
+    import asyncio
+
+    import asyncpg
+
+    from .column import Column
+    from .record import Record
+    from .table import Table
+
+
+class Loader:
+    """
+    Batches lookups of single rows by a key column of a table.
+
+    Keys loaded within the same event loop iteration, or within `window` seconds of the first if set, are fetched
+    together in a single `key = ANY($1)` query. Each call receives the row matching it's key, or None if there isn't
+    one. Batches are split into several queries if larger than `max_batch`.
+
+    Batches are fetched outside of the context of the calls, so they never run on a connection pinned by a caller's
+    transaction.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        key: t.Union[Column, str, None] = None,
+        *,
+        columns: t.Optional[t.Sequence[t.Union[Column, str]]] = None,
+        window: float = 0.0,
+        max_batch: t.Optional[int] = None,
+    ):
+        if max_batch is not None and max_batch < 1:
+            raise QueryError("Loader batch size must be at least 1.")
+        if key is None:
+            if len(table.primary_key) != 1:
+                raise SchemaError(f"Loader requires a key column for '{table}' without a single column primary key.")
+            key = table.primary_key[0]
+        self.table = table
+        self.key = table._column(key)
+        self.columns = [table._column(c) for c in columns] if columns else list(table.columns)
+        if self.key.name not in {c.name for c in self.columns}:
+            self.columns.append(self.key)
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: t.Dict[t.Any, asyncio.Future] = dict()
+        self._scheduled = False
+        self._tasks: t.Set[asyncio.Task] = set()
+
+    def __repr__(self):
+        return f"<Loader {self.key}>"
+
+    async def load(self, key: t.Any) -> t.Optional[t.Union[asyncpg.Record, Record]]:
+        """Return the row with the given key, fetched in a batch with other keys loaded at the same time."""
+        import asyncio
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if not self._scheduled:
+                self._scheduled = True
+                context = contextvars.Context()
+                if self.window:
+                    loop.call_later(self.window, self._dispatch, context=context)
+                else:
+                    loop.call_soon(self._dispatch, context=context)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: t.Iterable[t.Any]) -> t.List[t.Optional[t.Union[asyncpg.Record, Record]]]:
+        """Return the rows with each of the given keys, in the same order."""
+        import asyncio
+
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self):
+        """Start fetching all pending keys."""
+        import asyncio
+
+        pending, self._pending = self._pending, dict()
+        self._scheduled = False
+        keys = list(pending)
+        size = self.max_batch or len(keys)
+        for i in range(0, len(keys), size):
+            batch = {key: pending[key] for key in keys[i:i + size]}
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: t.Dict[t.Any, asyncio.Future]):
+        """Fetch the rows of a batch of keys, setting the result of each key's future."""
+        import asyncio
+
+        query = self.table.select(*self.columns)
+        query.where(self.key.in_(list(batch), as_array=True))
+        try:
+            rows = await query.fetch()
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # don't warn for calls that were cancelled while waiting
+            return
+
+        name = self.key.name
+        found = {(row[name] if hasattr(row, "keys") else getattr(row, name)): row for row in rows}
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
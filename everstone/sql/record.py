@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typing as t
+
+from ..exceptions import QueryError
+
+if t.TYPE_CHECKING:
+    from .table import Table
+
+
+class Record:
+    """
+    Base class for compact row classes generated for tables.
+
+    Each generated class stores it's columns in __slots__, so instances don't carry a __dict__.
+    Columns that weren't selected are left unset.
+    """
+
+    __slots__ = ()
+    __fields__: t.Tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        for name, value in zip(self.__fields__, args):
+            setattr(self, name, value)
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_row(cls, row: t.Mapping[str, t.Any]) -> Record:
+        """Create an instance from a fetched row, using it's column names."""
+        obj = cls.__new__(cls)
+        for name, value in row.items():
+            try:
+                setattr(obj, name, value)
+            except AttributeError:
+                raise QueryError(f"Fetched column '{name}' is not a field of {cls.__name__}.") from None
+        return obj
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        """Return the set column values as a dictionary."""
+        return {name: getattr(self, name) for name in self.__fields__ if hasattr(self, name)}
+
+    def copy(self) -> Record:
+        """Return a copy of this record with the same column values set."""
+        return type(self)(**self.as_dict())
+
+    def __eq__(self, other: t.Any):
+        if type(other) is type(self):
+            return self.as_dict() == other.as_dict()
+        return NotImplemented
+
+    def __repr__(self):
+        values = " ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"<{self.__class__.__name__} {values}>"
+
+
+def record_class(table: Table) -> t.Type[Record]:
+    """Generate a Record class for a table, with a slot typed by the Python type of each column."""
+    fields = tuple(col.name for col in table.columns)
+    annotations = {col.name: getattr(col.type, "py", t.Any) for col in table.columns}
+    name = "".join(part.capitalize() for part in table.name.split("_")) + "Record"
+    namespace = {
+        "__slots__": fields,
+        "__fields__": fields,
+        "__annotations__": annotations,
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": f"Row of {table.full_name}.",
+    }
+    return type(name, (Record,), namespace)
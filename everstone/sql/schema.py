@@ -13,6 +13,8 @@ class Schema(LimitInstances):
     """Represents a database schema."""
 
     def __init__(self, name: str, database: Database):
+        if getattr(self, "db", None) is database:
+            return  # existing instance returned by LimitInstances, keep it's tables
         self.name = name
         self.db: Database = database
         self.tables: t.Set[tbl.Table] = set()
@@ -27,8 +29,8 @@ class Schema(LimitInstances):
     async def prepare(self):
         """Ensure the schema exists in the database and prepare all child tables."""
         await self.create(if_exists=False)
-        for table in self.tables:
-            await table.prepare()
+        for level in tbl.dependency_order(self.tables):
+            await self.db.gather(*(table.prepare() for table in level))
 
     @property
     def exists(self) -> t.Optional[bool]:
@@ -49,13 +51,16 @@ class Schema(LimitInstances):
         self.name = name
         return result
 
-    async def create(self, *, if_exists: bool = True) -> str:
-        """Create the schema on the database."""
+    def create_sql(self, *, if_exists: bool = True) -> str:
+        """Generate the statement creating the schema."""
         if if_exists:
-            sql = f"CREATE SCHEMA {self.name};"
+            return f"CREATE SCHEMA {self.name};"
         else:
-            sql = f"CREATE SCHEMA IF NOT EXISTS {self.name};"
-        results = await self.db.execute(sql)
+            return f"CREATE SCHEMA IF NOT EXISTS {self.name};"
+
+    async def create(self, *, if_exists: bool = True) -> str:
+        """Create the schema on the database."""
+        results = await self.db.execute(self.create_sql(if_exists=if_exists), tables=self.tables)
         self._exists = True
         return results
 
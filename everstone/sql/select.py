@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import typing as t
 
-from . import where
+from . import columnar, where
+from .comparisons import And, Condition, Or, Parameter
+from .record import Record
 from .. import database
+from ..exceptions import QueryError
 
 if t.TYPE_CHECKING:
+    import asyncpg
+
     from .aggregates import Aggregate
     from .column import Column
     from .table import Table
 
 
 class Select:
+    __slots__ = (
+        "db", "where", "_columns", "_distinct", "_grouped", "_ordered", "_limit", "_offset", "_seek", "_conditions",
+        "_having", "_into",
+    )
+
     def __init__(self, db: database.Database = None):
         self.db = db or database.Database.get_default()
         self.where = where.Where(self)
@@ -23,8 +33,12 @@ class Select:
         self._distinct: t.Union[bool, tuple[Column, ...]] = False
         self._grouped = []
         self._ordered: t.Dict[Column, str] = dict()
+        self._limit: t.Optional[int] = None
+        self._offset: t.Optional[int] = None
+        self._seek: t.Optional[t.Tuple[t.Any, ...]] = None
         self._conditions = []
         self._having = []
+        self._into: t.Optional[t.Type[Record]] = None
 
     def select(self, *columns: Column) -> Select:
         self._columns.extend(columns)
@@ -37,10 +51,12 @@ class Select:
     def columns(self) -> t.Tuple[Column, ...]:
         return tuple(self._columns)
 
-    @property
-    def sql(self):
+    def compile(self) -> t.Tuple[str, tuple]:
+        """Render the statement, returning it with the values bound to it's placeholders."""
         if not self._columns:
-            return "SELECT NULL"
+            return "SELECT NULL", ()
+
+        args = []
 
         if self._distinct is True:
             sql = f"SELECT DISTINCT {self._column_str}"
@@ -53,21 +69,164 @@ class Select:
         if self._tables:
             sql += f" FROM {self._table_str}"
 
+        conditions = [self.where.compile(args)] if self.where else []
+        if self._seek is not None:
+            conditions.append(self._seek_condition().compile(args))
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+
         if self._grouped:
             cols = ", ".join(str(c) for c in self._grouped)
             sql += f" GROUP BY {cols}"
 
-        return f"{sql};"
+        if self._ordered:
+            cols = ", ".join(f"{c} {direction}" for c, direction in self._ordered.items())
+            sql += f" ORDER BY {cols}"
+
+        if self._limit is not None:
+            sql += f" LIMIT {Parameter(self._limit).compile(args)}"
+
+        if self._offset is not None:
+            sql += f" OFFSET {Parameter(self._offset).compile(args)}"
+
+        return f"{sql};", tuple(args)
+
+    @property
+    def sql(self) -> str:
+        return self.compile()[0]
+
+    @property
+    def args(self) -> tuple:
+        """Values bound to this statement, in placeholder order."""
+        return self.compile()[1]
 
     def __call__(self, *columns: Column) -> Select:
         return self.new().select(*columns)
 
     def __await__(self):
-        return self.db.execute(self.sql).__await__()
+        return self.fetch().__await__()
+
+    async def fetch(self) -> t.List[asyncpg.Record]:
+        """Execute the statement, returning all resulting rows."""
+        sql, args = self.compile()
+        return await self.db.fetch(sql, *args, readonly=True, into=self._into, tables=self._tables)
+
+    async def fetchrow(self) -> t.Optional[asyncpg.Record]:
+        """Execute the statement, returning the first resulting row."""
+        sql, args = self.compile()
+        return await self.db.fetchrow(sql, *args, readonly=True, into=self._into, tables=self._tables)
+
+    async def fetchval(self, column: int = 0) -> t.Any:
+        """Execute the statement, returning a value from the first resulting row."""
+        sql, args = self.compile()
+        return await self.db.fetchval(sql, *args, column=column, readonly=True, tables=self._tables)
+
+    async def stream(
+        self,
+        batch: int = 100,
+        *,
+        chunked: bool = False,
+    ) -> t.AsyncIterator[t.Union[asyncpg.Record, t.List[asyncpg.Record]]]:
+        """Execute the statement, yielding rows, or lists of rows if chunked, from a server-side cursor."""
+        sql, args = self.compile()
+        async for rows in self.db.stream(
+            sql, *args, batch=batch, chunked=chunked, readonly=True, into=self._into
+        ):
+            yield rows
+
+    async def fetch_columns(self, batch: int = 10000, *, numpy: t.Optional[bool] = None) -> t.Dict[str, t.Any]:
+        """
+        Execute the statement, returning a buffer of values for each selected column by name.
+
+        Columns with a numeric SQL type are stored in an array, or a NumPy array if installed, and others in a list.
+        """
+        names = self._result_names
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise QueryError(f"Selected columns have the same names {duplicates}, alias them with as_ to fetch them.")
+        sql, args = self.compile()
+        columns = {name: columnar.typecode(c) for name, c in zip(names, self._columns)}
+        return await self.db.fetch_columns(sql, *args, columns=columns, batch=batch, numpy=numpy, readonly=True)
+
+    def into(self, record_class: t.Optional[t.Type[Record]]) -> Select:
+        """Decode fetched rows as instances of the given Record class, such as Table.record_class."""
+        self._into = record_class
+        return self
 
     def group_by(self, *columns):
         self._grouped = list(columns)
 
+    def order_by(self, *columns: t.Union[Column, str]) -> Select:
+        """Set the ordering of results, using the sort direction of each column set by Column.asc or Column.desc."""
+        self._ordered = {c: getattr(c, "sort_direction", None) or "ASC" for c in columns}
+        return self
+
+    def limit(self, count: t.Optional[int]) -> Select:
+        """Limit the number of rows returned."""
+        self._limit = count
+        return self
+
+    def offset(self, count: t.Optional[int]) -> Select:
+        """Skip a number of rows before returning results."""
+        self._offset = count
+        return self
+
+    def page_after(self, last_row: t.Any, size: int) -> Select:
+        """
+        Return the page of results following the given row, using keyset pagination on the ordered columns.
+
+        The row can be a fetched record, a mapping of column names or a sequence of values in the order of the
+        ordering columns. The first page is returned if it's None. Rows are found with a seek condition on the
+        ordering columns instead of an offset, so each page costs the same regardless of how deep it is. Values are
+        read from mappings by the name each ordering column is selected under.
+        """
+        if not self._ordered:
+            raise QueryError("Keyset pagination requires an ordering, use Select.order_by first.")
+        if last_row is None:
+            self._seek = None
+        elif isinstance(last_row, t.Mapping) or hasattr(last_row, "keys"):
+            self._seek = tuple(last_row[self._ordered_name(c)] for c in self._ordered)
+        elif isinstance(last_row, Record):
+            self._seek = tuple(getattr(last_row, getattr(c, "name", c)) for c in self._ordered)
+        else:
+            self._seek = tuple(last_row)
+        if self._seek is not None and len(self._seek) != len(self._ordered):
+            raise QueryError("Keyset pagination requires a value for each ordering column.")
+        self._offset = None
+        self._limit = size
+        return self
+
+    def _ordered_name(self, col: t.Union[Column, str]) -> str:
+        """Name of an ordering column in fetched rows, which is the alias it's selected under if any."""
+        base = col.reset_modifiers() if hasattr(col, "reset_modifiers") else col
+        for selected, name in zip(self._columns, self._result_names):
+            if hasattr(selected, "reset_modifiers") and selected.reset_modifiers() is base:
+                return name
+        return getattr(base, "name", base)
+
+    def _seek_condition(self) -> Condition:
+        """Condition selecting rows after the seek values in the current ordering."""
+        order = list(zip(self._ordered.items(), self._seek))
+        directions = set(self._ordered.values())
+        if len(directions) == 1:
+            operator = " > " if directions == {"ASC"} else " < "
+            if len(order) == 1:
+                (col, _), value = order[0]
+                return Condition(str(col), operator, Parameter(value))
+            cols = ", ".join(str(c) for c in self._ordered)
+            params = []
+            for i, value in enumerate(self._seek):
+                params += [", ", Parameter(value)] if i else [Parameter(value)]
+            return Condition(f"({cols})", operator, "(", *params, ")")
+
+        # mixed directions can't use a row comparison, so expand it into the equivalent conditions
+        alternatives = []
+        for i, ((col, direction), value) in enumerate(order):
+            operator = " > " if direction == "ASC" else " < "
+            equal = [Condition(str(c), " = ", Parameter(v)) for (c, _), v in order[:i]]
+            alternatives.append(And(*equal, Condition(str(col), operator, Parameter(value))))
+        return Or(*alternatives)
+
     @property
     def groups(self) -> t.List[Column]:
         return self._grouped
@@ -78,7 +237,24 @@ class Select:
 
     @property
     def _column_str(self) -> str:
-        return ", ".join(str(c) for c in self._columns)
+        return ", ".join(self._column_sql(c) for c in self._columns)
+
+    @property
+    def _result_names(self) -> t.List[str]:
+        """Names of the resulting columns, in order."""
+        return [
+            getattr(c, "alias", None) or getattr(c, "name", None) or str(c).rpartition(" AS ")[2].rpartition(".")[2]
+            for c in self._columns
+        ]
+
+    @staticmethod
+    def _column_sql(col: t.Union[Column, Aggregate, str]) -> str:
+        """Render a selected column, with it's alias if set."""
+        alias = getattr(col, "alias", None)
+        if not alias:
+            return str(col)
+        expression = col.sql if hasattr(col, "sql") else col.full_name
+        return f"{expression} AS {alias}"
 
     @property
     def _table_str(self) -> str:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import typing as t
 
-from . import aggregates, column, select
+from . import aggregates, column, loader, record, select, types
 from .. import database
+from ..cache import INVALIDATION_CHANNEL
 from ..exceptions import SchemaError
 
 if t.TYPE_CHECKING:
@@ -13,6 +15,34 @@ if t.TYPE_CHECKING:
     from .types import SQLType
 
 
+RecordData = t.Union[t.Sequence[t.Any], t.Mapping[str, t.Any]]
+
+
+def dependency_order(tables: t.Iterable[Table]) -> t.List[t.List[Table]]:
+    """
+    Group tables into levels where each table only references tables in earlier levels.
+
+    Tables within a level don't depend on each other, so they can be created concurrently.
+    """
+    tables = sorted(set(tables), key=lambda tbl: tbl.full_name)
+    lookup = {tbl.name: tbl for tbl in tables}
+    lookup.update({tbl.full_name: tbl for tbl in tables})
+    pending = {tbl: {lookup.get(str(ref)) for ref in tbl.references} - {None, tbl} for tbl in tables}
+
+    levels = []
+    while pending:
+        ready = [tbl for tbl, deps in pending.items() if not deps]
+        if not ready:
+            names = ", ".join(tbl.full_name for tbl in pending)
+            raise SchemaError(f"Circular foreign key references between tables: {names}")
+        levels.append(ready)
+        for tbl in ready:
+            del pending[tbl]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return levels
+
+
 class Columns:
     def __init__(self, table: Table):
         self.table: Table = table
@@ -33,6 +63,9 @@ class Columns:
     def __setitem__(self, key: str, value: column.Column):
         self._columns[key] = value
 
+    def __contains__(self, item: str) -> bool:
+        return item in self._columns
+
     def __getattr__(self, item) -> column.Column:
         with contextlib.suppress(KeyError):
             return self._columns[item]
@@ -58,12 +91,21 @@ class Table:
         self.constraints: t.Set[Constraint] = set()
 
         self.select = select.Select(self.db)
+        self._record_class: t.Optional[t.Type[record.Record]] = None
 
     def __getitem__(self, item: str) -> column.Column:
         return self.columns[item]
 
     def __setitem__(self, key: str, value: column.Column):
         self.columns[key] = value
+        self._record_class = None
+
+    @property
+    def record_class(self) -> t.Type[record.Record]:
+        """Compact row class with a slot for each column, generated on first use."""
+        if self._record_class is None:
+            self._record_class = record.record_class(self)
+        return self._record_class
 
     @property
     def full_name(self) -> str:
@@ -97,36 +139,209 @@ class Table:
         for c in columns:
             c.bind_table(self)
             self.columns[c.name] = c
+        self._record_class = None
         return self
 
     def add_constraints(self, *constraints: Constraint):
         for c in constraints:
             self.constraints.add(c)
 
+    @property
+    def references(self) -> t.Set[t.Union[Table, str]]:
+        """Tables referenced by foreign key constraints of this table or it's columns."""
+        from .constraints import ForeignKey
+
+        refs = set()
+        for con in itertools.chain(self.constraints, *(c.constraints for c in self.columns)):
+            while hasattr(con, "constraint"):
+                con = con.constraint
+            if isinstance(con, ForeignKey):
+                refs.add(con.table)
+        return refs
+
     async def prepare(self):
-        """Ensure the table exists in the database."""
-        await self.create(if_not_exists=True)
+        """Ensure the table exists in the database, within it's schema."""
+        await self.create(if_not_exists=True, qualified=True)
 
-    async def create(self, if_not_exists: bool = False) -> str:
-        """Create the table in the database."""
+    def create_sql(self, if_not_exists: bool = False, *, qualified: bool = False) -> str:
+        """Generate the statement creating the table, naming it with it's schema if qualified."""
         if not self.columns:
             raise SchemaError("Table creation failed: No columns.")
         exists = "IF NOT EXISTS " if if_not_exists else ""
         cols = [col.definition for col in self.columns]
         constraints = [con.sql for con in self.constraints]
         schema = ", ".join(cols + constraints)
-        sql = f"CREATE TABLE {exists}{self.name} ({schema});"
-        return await self.db.execute(sql)
+        name = self.full_name if qualified else self.name
+        return f"CREATE TABLE {exists}{name} ({schema});"
+
+    async def create(self, if_not_exists: bool = False, *, qualified: bool = False) -> str:
+        """Create the table in the database, naming it with it's schema if qualified."""
+        return await self.db.execute(self.create_sql(if_not_exists, qualified=qualified), tables=[self])
 
     async def drop(self, if_exists: bool = False, cascade: bool = False) -> str:
         """Drop the table from the database."""
         exists = "IF EXISTS " if if_exists else ""
         cascade = " CASCADE" if cascade else ""
         sql = f"DROP TABLE {exists}{self.name}{cascade};"
-        return await self.db.execute(sql)
+        return await self.db.execute(sql, tables=None if cascade else [self])
+
+    def notify_trigger_sql(self, channel: str = INVALIDATION_CHANNEL) -> str:
+        """
+        Generate the statements creating a trigger notifying a channel of changes to the table.
+
+        The notification payload is the full name of the table, as received by Database.listen.
+        """
+        function = f"{self.schema}.everstone_notify"
+        channel = channel.replace("'", "''")
+        return (
+            f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$ "
+            f"BEGIN PERFORM pg_notify(TG_ARGV[0], TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME); RETURN NULL; END; $$; "
+            f"DROP TRIGGER IF EXISTS everstone_notify ON {self.full_name}; "
+            f"CREATE TRIGGER everstone_notify AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {self.full_name} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}('{channel}');"
+        )
+
+    async def create_notify_trigger(self, channel: str = INVALIDATION_CHANNEL) -> str:
+        """Create a trigger notifying a channel of changes to the table, for invalidating caches in other processes."""
+        return await self.db.execute(self.notify_trigger_sql(channel), tables=[self])
+
+    async def copy_records(
+        self,
+        records: t.Union[t.Iterable[RecordData], t.AsyncIterable[RecordData]],
+        columns: t.Optional[t.Sequence[t.Union[column.Column, str]]] = None,
+        *,
+        timeout: t.Optional[float] = None,
+    ) -> str:
+        """
+        Bulk load records into the table using the COPY protocol.
+
+        Records are streamed from the given iterable or async iterable as they're consumed, and can be sequences in
+        the order of the given columns or mappings of column names, defaulting to all columns of the table.
+        """
+        names = [self._column(c).name for c in columns] if columns else [c.name for c in self.columns]
+        if not names:
+            raise SchemaError("Copying records failed: No columns.")
+
+        if isinstance(records, t.AsyncIterable):
+            records = self._arecord_tuples(records, names)
+        else:
+            records = self._record_tuples(records, names)
+
+        return await self.db.copy_records(
+            self.name, records, columns=names, schema_name=self.schema.name, timeout=timeout
+        )
+
+    @property
+    def primary_key(self) -> t.Tuple[column.Column, ...]:
+        """Columns making up the primary key of the table."""
+        from .constraints import CompositeConstraint, PrimaryKey
+
+        for con in self.constraints:
+            if isinstance(con, CompositeConstraint) and con.constraint == PrimaryKey:
+                return tuple(c if isinstance(c, column.Column) else self.columns[c] for c in con.columns)
+        return tuple(c for c in self.columns if PrimaryKey in c.constraints)
+
+    def upsert_sql(
+        self,
+        columns: t.Optional[t.Sequence[t.Union[column.Column, str]]] = None,
+        conflict: t.Union[column.Column, str, t.Sequence[t.Union[column.Column, str]], None] = None,
+    ) -> str:
+        """
+        Generate the statement inserting arrays of column values as rows, updating rows already existing.
+
+        Each column's values are bound as a single array, so the statement is identical for any number of rows. Array
+        columns aren't supported, as unnest flattens arrays of arrays into single values.
+        """
+        cols = [self._column(c) for c in columns] if columns else list(self.columns)
+        if not cols:
+            raise SchemaError("Upsert failed: No columns.")
+        array_columns = [c.name for c in cols if isinstance(c.type, types.Array)]
+        if array_columns:
+            raise SchemaError(f"Upsert failed: Array columns {array_columns} can't be bound as arrays of rows.")
+
+        conflict_names = self._conflict_names(conflict)
+        if not conflict_names:
+            raise SchemaError("Upsert failed: No conflict columns or primary key.")
+
+        names = ", ".join(c.name for c in cols)
+        arrays = ", ".join(f"${i}::{c.cast}[]" for i, c in enumerate(cols, 1))
+        updates = ", ".join(f"{c.name} = EXCLUDED.{c.name}" for c in cols if c.name not in conflict_names)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        return (
+            f"INSERT INTO {self.full_name} ({names}) SELECT * FROM unnest({arrays})"
+            f" ON CONFLICT ({', '.join(conflict_names)}) {action};"
+        )
+
+    async def upsert_many(
+        self,
+        rows: t.Iterable[RecordData],
+        conflict: t.Union[column.Column, str, t.Sequence[t.Union[column.Column, str]], None] = None,
+        *,
+        columns: t.Optional[t.Sequence[t.Union[column.Column, str]]] = None,
+        timeout: t.Optional[float] = None,
+    ) -> str:
+        """
+        Insert rows in a single statement, updating existing rows that conflict.
+
+        Conflicts are checked on the given columns, defaulting to the primary key of the table.
+        Rows can be sequences in the order of the given columns or mappings of column names,
+        defaulting to all columns of the table. Rows repeating the conflict values of an earlier row replace it, so
+        only the last row for each key is upserted, as a single statement can't update a row twice.
+        """
+        sql = self.upsert_sql(columns, conflict)
+        names = [self._column(c).name for c in columns] if columns else [c.name for c in self.columns]
+        rows = self._record_tuples(rows, names)
+        conflict_names = self._conflict_names(conflict)
+        if all(n in names for n in conflict_names):
+            keys = [names.index(n) for n in conflict_names]
+            rows = {tuple(row[i] for i in keys): row for row in rows}.values()
+        values = list(zip(*rows)) or [() for _ in names]
+        return await self.db.execute(sql, *(list(v) for v in values), tables=[self], timeout=timeout)
+
+    def _conflict_names(
+        self, conflict: t.Union[column.Column, str, t.Sequence[t.Union[column.Column, str]], None]
+    ) -> t.List[str]:
+        """Return the names of the given conflict columns, defaulting to the primary key of the table."""
+        if conflict is None:
+            conflict = self.primary_key
+        elif isinstance(conflict, (column.Column, str)):
+            conflict = [conflict]
+        return [self._column(c).name for c in conflict]
+
+    def _column(self, col: t.Union[column.Column, str]) -> column.Column:
+        """Return the column of this table matching the given column or column name."""
+        name = getattr(col, "name", col)
+        if name not in self.columns:
+            raise SchemaError(f"Column '{name}' not found on '{self}'.")
+        return self.columns[name]
+
+    @staticmethod
+    def _record_tuples(records: t.Iterable[RecordData], names: t.Sequence[str]) -> t.Iterator[t.Sequence]:
+        for row in records:
+            yield tuple(row[n] for n in names) if isinstance(row, t.Mapping) else row
+
+    @staticmethod
+    async def _arecord_tuples(
+        records: t.AsyncIterable[RecordData],
+        names: t.Sequence[str],
+    ) -> t.AsyncIterator[t.Sequence]:
+        async for row in records:
+            yield tuple(row[n] for n in names) if isinstance(row, t.Mapping) else row
+
+    def loader(
+        self,
+        key: t.Union[column.Column, str, None] = None,
+        *,
+        columns: t.Optional[t.Sequence[t.Union[column.Column, str]]] = None,
+        window: float = 0.0,
+        max_batch: t.Optional[int] = None,
+    ) -> loader.Loader:
+        """Return a Loader batching lookups of rows by a key column, defaulting to the primary key."""
+        return loader.Loader(self, key, columns=columns, window=window, max_batch=max_batch)
 
     def Column(self, name: str, type: SQLType, *constraints: Constraint) -> Column:
         """Return a Column instance bound to this table."""
         col = column.Column(name, type, *constraints).bind_table(self)
         self.columns[col.name] = col
+        self._record_class = None
         return col
@@ -4,7 +4,6 @@ import abc
 import datetime
 import decimal
 import typing as t
-import zoneinfo
 
 
 # region: Bases
@@ -137,6 +136,7 @@ class Serial(Integer):
     """
 
     sql = "SERIAL"
+    cast = "INTEGER"
 
 
 class SmallSerial(Serial):
@@ -147,6 +147,7 @@ class SmallSerial(Serial):
     """
 
     sql = "SMALLSERIAL"
+    cast = "SMALLINT"
 
 
 class BigSerial(Serial):
@@ -157,6 +158,7 @@ class BigSerial(Serial):
     """
 
     sql = "BIGSERIAL"
+    cast = "BIGINT"
 
 
 class Numeric(SQLType):
@@ -327,7 +329,7 @@ class Time(SQLType):
 
     # special values
     now = SpecialValue(lambda: datetime.datetime.now().time(), "Now")
-    allballs = SpecialValue(datetime.time(0, 0, 0, 0, zoneinfo.ZoneInfo("UTC")), "Allballs")
+    allballs = SpecialValue(datetime.time(0, 0, 0, 0, datetime.timezone.utc), "Allballs")
 
     def __init__(self, precision: int):  # noqa
         self.precision = precision
@@ -6,6 +6,8 @@ from .comparisons import Condition
 
 
 class Where:
+    __slots__ = ("query", "_conditions")
+
     def __init__(self, query):
         self.query = query
         self._conditions: list[Condition] = []
@@ -16,6 +18,9 @@ class Where:
     def clear(self):
         self._conditions.clear()
 
+    def __bool__(self):
+        return bool(self._conditions)
+
     def __call__(self, *conditions: t.Union[Condition, str]) -> Where:
         for c in conditions:
             if isinstance(c, str):
@@ -23,6 +28,17 @@ class Where:
             self.add_condition(c)
         return self
 
+    def compile(self, args: list) -> str:
+        """Render the conditions, binding their values to the given arguments list."""
+        return " AND ".join(c.compile(args) for c in self._conditions)
+
+    @property
+    def sql(self) -> str:
+        return self.compile([])
+
     @property
-    def sql(self):
-        return " AND ".join(str(c) for c in self._conditions)
+    def args(self) -> tuple:
+        """Values bound to these conditions, in placeholder order."""
+        args = []
+        self.compile(args)
+        return tuple(args)
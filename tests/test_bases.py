@@ -0,0 +1,76 @@
+"""Testing of instance registry functionality."""
+
+import gc
+import threading
+
+from everstone.bases import InstanceRegistry, LimitInstances
+
+
+class Weak(LimitInstances):
+    __retained__ = 0
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Bounded(LimitInstances):
+    __retained__ = 2
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+def test_registry_weak():
+    a = Weak("a")
+    assert Weak("a") is a
+    assert Weak.__instances__ is not Bounded.__instances__
+    assert "a" in Weak.__instances__
+    del a
+    gc.collect()
+    assert "a" not in Weak.__instances__
+    assert len(Weak.__instances__) == 0
+
+
+def test_registry_bounded():
+    b = Bounded("b")
+    Bounded("c")
+    Bounded("d")
+    Bounded("e")
+    gc.collect()
+    assert sorted(Bounded.__instances__) == ["b", "d", "e"]
+    assert repr(Bounded.__instances__) == "<InstanceRegistry instances=3 retained=2>"
+    assert Bounded.__instances__["d"].name == "d"
+    assert Bounded("b") is b
+    del b
+    gc.collect()
+    assert sorted(Bounded.__instances__) == ["b", "d"]
+    del Bounded.__instances__["d"]
+    gc.collect()
+    assert list(Bounded.__instances__) == ["b"]
+    Bounded.__instances__.clear()
+    assert len(Bounded.__instances__) == 0
+
+
+def test_registry_unbounded():
+    registry = InstanceRegistry(None)
+    for i in range(10):
+        registry[str(i)] = Weak(str(i))
+    gc.collect()
+    assert len(registry) == 10
+    assert registry.get("10") is None
+
+
+def test_registry_threads():
+    barrier = threading.Barrier(8)
+    instances = []
+
+    def create():
+        barrier.wait()
+        instances.append(Weak("threaded"))
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(i) for i in instances}) == 1
@@ -0,0 +1,287 @@
+"""Testing of query result caching functionality."""
+
+import asyncio
+import os
+
+import asyncpg
+import pytest
+
+import everstone
+from everstone.cache import ResultCache, freeze, sizeof
+from everstone.database import Database
+from everstone.sql import types
+from everstone.sql.select import Select
+
+everstone.db.disable_execution()
+
+
+def test_cache_key():
+    assert ResultCache.key("fetch", "SELECT $1;", ([1, 2],)) == ("fetch", "SELECT $1;", ((1, 2),))
+    assert ResultCache.key("fetch", "SELECT $1;", ({"a": 1},)) is None
+    assert freeze([1, [2, 3]]) == (1, (2, 3))
+    assert sizeof(["abc", ("def", 1)]) > sizeof([])
+
+
+def test_cache_lru():
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1, ["public.a"])
+    cache.set("b", 2, ["public.b"])
+    assert cache.get("a") == 1
+    cache.set("c", 3, ["public.a", "public.b"])
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert cache.get("b", "missing") == "missing"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert repr(cache) == f"<ResultCache entries=2 bytes={cache.size} hits=1 misses=1>"
+
+    cache = ResultCache(max_bytes=sizeof("x" * 100) * 2)
+    cache.set("a", "x" * 100, [])
+    cache.set("b", "x" * 100, [])
+    cache.set("c", "x" * 100, [])
+    assert list(cache._entries) == ["b", "c"]
+    cache.set("d", "x" * 1000, [])
+    assert "d" not in cache
+
+
+def test_cache_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("everstone.cache.time.monotonic", lambda: now)
+    cache = ResultCache(ttl=10)
+    cache.set("a", 1, [])
+    now = 105.0
+    assert cache.get("a") == 1
+    now = 110.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_invalidate():
+    cache = ResultCache()
+    cache.set("a", 1, ["public.a"])
+    cache.set("ab", 2, ["public.a", "public.b"])
+    cache.set("b", 3, ["public.b"])
+    generation = cache.generation
+    cache.invalidate(["public.a"])
+    assert list(cache._entries) == ["b"]
+    assert cache._tables == {"public.b": {"b"}}
+    cache.set("a", 1, ["public.a"], generation=generation)
+    assert "a" not in cache
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.size == 0
+    cache.get("a")
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_db_cache():
+    db = Database("test_db_cache")
+    db.disable_execution()
+    table = db.Table("cached")
+    col = table.Column("col", types.Integer)
+    other = db.Table("other").Column("col", types.Integer)
+    cache = db.enable_cache(ttl=60)
+    assert db.cache is cache
+    with db.stmt_tracking():
+        query = table.select(col)
+        query.where(col > 1)
+        assert await query == ("SELECT public.cached.col FROM public.cached WHERE public.cached.col > $1;", 1)
+        assert await query.fetch() == await query
+        await query.fetchval()
+        await other.table.select(other).fetchrow()
+        await db.fetch("SELECT 1;", readonly=True)
+        assert len(db._tracking.get()) == 4
+        assert len(cache) == 3
+
+        await other.table.upsert_many([(1,)], conflict=other)
+        assert len(cache) == 2
+        await table.copy_records([(1,)])
+        assert len(cache) == 0
+
+        await query
+        await db.execute("SELECT 1;")
+        assert len(cache) == 0
+
+        async with db.transaction():
+            await query
+            await table.drop()
+        assert len(cache) == 0
+        assert len(db._tracking.get()) == 12
+
+    db.disable_cache()
+    assert db.cache is None
+    del db["test_db_cache"]
+
+
+@pytest.mark.asyncio
+async def test_db_cache_unknown_tables():
+    db = Database("test_db_cache_unknown_tables")
+    db.disable_execution()
+    cache = db.enable_cache(ttl=60)
+    with db.stmt_tracking():
+        query = Select(db)("count(*) FROM public.users")
+        await query.fetch()
+        await db.fetch("SELECT 1;", readonly=True, tables=[])
+        assert len(cache) == 0
+        await db.execute("DELETE FROM public.users;", tables=["public.users"])
+        await query.fetch()
+        assert len(db._tracking.get()) == 4
+    del db["test_db_cache_unknown_tables"]
+
+
+@pytest.mark.asyncio
+async def test_db_cache_records():
+    db = Database("test_db_cache_records")
+    table = db.Table("cached_records")
+    col = table.Column("col", types.Integer)
+    cache = db.enable_cache()
+
+    async def run(method, *args, **kwargs):
+        return [{"col": 1}] if method == "fetch" else {"col": 1}
+
+    db._run = run
+    query = table.select(col).into(table.record_class)
+    rows = await query.fetch()
+    rows[0].col = 2
+    assert [row.col for row in await query.fetch()] == [1]
+    row = await query.fetchrow()
+    row.col = 2
+    assert (await query.fetchrow()).col == 1
+    assert len(cache) == 2
+    del db["test_db_cache_records"]
+
+
+def test_cache_lagging(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("everstone.cache.time.monotonic", lambda: now)
+    cache = ResultCache(replica_lag=1.0)
+    assert not cache.lagging(["public.a"])
+    cache.invalidate(["public.a"])
+    assert cache.lagging(["public.a", "public.b"])
+    assert not cache.lagging(["public.b"])
+    now = 101.0
+    assert not cache.lagging(["public.a"])
+    cache.invalidate()
+    assert cache.lagging(["public.b"])
+
+
+@pytest.mark.asyncio
+async def test_db_cache_replicas(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("everstone.cache.time.monotonic", lambda: now)
+    db = Database("test_db_cache_replicas")
+    db.disable_execution()
+    db.add_replica("postgres://replica")
+    col = db.Table("cached").Column("col", types.Integer)
+    query = col.table.select(col)
+    cache = db.enable_cache(replica_lag=1.0)
+    await query
+    assert len(cache) == 1
+
+    await col.table.copy_records([(1,)])
+    await query
+    assert len(cache) == 0  # read from a replica that may not have the write yet
+    with db.primary():
+        await query
+    assert len(cache) == 1
+
+    cache.clear()
+    now = 102.0
+    await query
+    assert len(cache) == 1
+    del db["test_db_cache_replicas"]
+
+
+@pytest.mark.asyncio
+async def test_db_cache_listen():
+    db = Database("test_db_cache_listen")
+    db.disable_execution()
+    table = db.Table("listened")
+    col = table.Column("col", types.Integer)
+    cache = db.enable_cache()
+    with db.stmt_tracking():
+        await db.listen()
+        assert db._tracking.get() == [("LISTEN everstone_invalidation;", ())]
+    await table.select(col).fetch()
+    await db.Table("other").select(db.Table("other").Column("col", types.Integer)).fetch()
+    db._on_notify(None, 1, "everstone_invalidation", "public.listened")
+    assert len(cache) == 1
+    db._on_notify(None, 1, "everstone_invalidation", "")
+    assert len(cache) == 0
+    await db.unlisten()
+    del db["test_db_cache_listen"]
+
+
+@pytest.mark.asyncio
+async def test_db_cache_listener_lost(monkeypatch):
+    db = Database("test_db_cache_listener_lost")
+    db.disable_execution()
+    table = db.Table("listened")
+    query = table.select(table.Column("col", types.Integer))
+    cache = db.enable_cache()
+    await db.listen("custom_channel")
+    await query.fetch()
+    assert len(cache) == 1
+
+    monkeypatch.setattr("everstone.database.LISTEN_RETRY_DELAY", 0)
+    listen = db._listen
+    attempts = []
+
+    async def flaky_listen(channel):
+        attempts.append(channel)
+        if len(attempts) == 1:
+            raise OSError("connection refused")
+        await listen(channel)
+
+    db._listen = flaky_listen
+    db._on_listener_lost(None)
+    assert len(cache) == 0
+    await query.fetch()
+    assert len(cache) == 0
+
+    await db._relisten_task
+    assert attempts == ["custom_channel", "custom_channel"]
+    assert db._relisten_task is None
+    await query.fetch()
+    assert len(cache) == 1
+
+    db._on_listener_lost(None)
+    await db.unlisten()
+    assert db._relisten_task is None
+    await query.fetch()
+    assert len(cache) == 1
+    del db["test_db_cache_listener_lost"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.environ.get("EVERSTONE_TEST_DSN"), reason="EVERSTONE_TEST_DSN isn't set.")
+async def test_db_cache_listen_postgres():  # pragma: no cover
+    dsn = os.environ["EVERSTONE_TEST_DSN"]
+    db = Database("test_db_cache_listen_postgres")
+    db.url = dsn
+    table = db.Table("everstone_listen_test")
+    col = table.Column("col", types.Integer)
+    await table.create(if_not_exists=True)
+    await table.create_notify_trigger()
+    cache = db.enable_cache()
+    await db.listen()
+    try:
+        await table.select(col).fetch()
+        assert len(cache) == 1
+
+        conn = await asyncpg.connect(dsn)
+        try:
+            await conn.execute("INSERT INTO public.everstone_listen_test (col) VALUES (1);")
+        finally:
+            await conn.close()
+        for _ in range(100):
+            if not len(cache):
+                break
+            await asyncio.sleep(0.01)
+        assert len(cache) == 0
+    finally:
+        await table.drop(if_exists=True)
+        await db.close()
+        del db["test_db_cache_listen_postgres"]
@@ -0,0 +1,105 @@
+"""Testing of catalog diff functionality."""
+
+import pytest
+
+import everstone
+from everstone.database import Database
+from everstone.sql import catalog, constraints, types
+
+everstone.db.disable_execution()
+
+
+@pytest.fixture
+def sync_db():
+    db = Database("test_db_sync")
+    db.disable_execution()
+    schema = db.Schema("sync_schema")
+    parent = schema.Table("sync_parent")
+    parent_id = parent.Column("parent_id", types.Integer, constraints.PrimaryKey)
+    parent.Column("name", types.Text)
+    parent.Column("created", types.TimestampTZ(3))
+    child = schema.Table("sync_child")
+    child.Column("parent_id", types.Integer, constraints.ForeignKey(parent_id))
+    child.add_constraints(constraints.Unique.columns(child.columns.parent_id).named("sync_child_unique"))
+    yield db
+    del db["test_db_sync"]
+
+
+def test_catalog_type():
+    assert catalog.catalog_type(types.Integer.sql) == "integer"
+    assert catalog.catalog_type(types.BigSerial.sql) == "bigint"
+    assert catalog.catalog_type(types.DoublePrecision.sql) == "double precision"
+    assert catalog.catalog_type(types.Numeric(10, 2).sql) == "numeric(10,2)"
+    assert catalog.catalog_type(types.Timestamp.sql) == "timestamp without time zone"
+    assert catalog.catalog_type(types.TimestampTZ(3).sql) == "timestamp(3) with time zone"
+    assert catalog.catalog_type(types.Time(2).sql) == "time(2) without time zone"
+    assert catalog.catalog_type(types.Array(types.Text, 2).sql) == "text[]"
+    assert catalog.catalog_type("VARCHAR(20)") == "character varying(20)"
+    assert catalog.catalog_type("varchar") == "character varying"
+    assert catalog.catalog_type("CHAR(3)") == "character(3)"
+    assert catalog.catalog_type("CHAR") == "character(1)"
+    assert catalog.catalog_type("BIT VARYING(8)") == "bit varying(8)"
+
+
+def test_catalog_diff_empty(sync_db):
+    changes = catalog.diff(sync_db.schemas, [])
+    assert changes
+    assert changes.schemas == ["CREATE SCHEMA IF NOT EXISTS sync_schema;"]
+    assert changes.tables == [
+        ["CREATE TABLE IF NOT EXISTS sync_schema.sync_parent"
+         " (parent_id INTEGER PRIMARY KEY, name TEXT, created TIMESTAMP(3) WITH TIME ZONE);"],
+        ["CREATE TABLE IF NOT EXISTS sync_schema.sync_child"
+         " (parent_id INTEGER REFERENCES sync_schema.sync_parent (parent_id),"
+         " CONSTRAINT sync_child_unique UNIQUE (parent_id));"],
+    ]
+    assert changes.alterations == []
+    assert len(changes.statements) == 3
+
+
+def test_catalog_diff_existing(sync_db):
+    rows = [
+        {"kind": "schema", "schema_name": "sync_schema", "table_name": None, "name": None, "detail": None},
+        {"kind": "table", "schema_name": "sync_schema", "table_name": "sync_parent", "name": None, "detail": None},
+        {"kind": "table", "schema_name": "sync_schema", "table_name": "sync_child", "name": None, "detail": None},
+    ]
+    columns = [
+        ("sync_parent", "parent_id", "integer"),
+        ("sync_parent", "name", "character varying"),
+        ("sync_parent", "legacy", "text"),
+        ("sync_child", "parent_id", "integer"),
+    ]
+    rows += [
+        {"kind": "column", "schema_name": "sync_schema", "table_name": tbl, "name": name, "detail": detail}
+        for tbl, name, detail in columns
+    ]
+    changes = catalog.diff(sync_db.schemas, rows)
+    assert changes.schemas == []
+    assert changes.tables == []
+    assert changes.alterations == [
+        "ALTER TABLE sync_schema.sync_child ADD CONSTRAINT sync_child_unique UNIQUE (parent_id);",
+        "ALTER TABLE sync_schema.sync_parent ADD COLUMN created TIMESTAMP(3) WITH TIME ZONE;",
+    ]
+    assert changes.drift == [
+        "Column sync_schema.sync_parent.name is character varying, declared as text.",
+        "Column sync_schema.sync_parent.legacy exists but is not declared.",
+    ]
+    rows.append({
+        "kind": "constraint", "schema_name": "sync_schema", "table_name": "sync_child",
+        "name": "sync_child_unique", "detail": "UNIQUE (parent_id)",
+    })
+    rows.append({
+        "kind": "column", "schema_name": "sync_schema", "table_name": "sync_parent",
+        "name": "created", "detail": "timestamp(3) with time zone",
+    })
+    assert not catalog.diff(sync_db.schemas, rows)
+
+
+@pytest.mark.asyncio
+async def test_catalog_prepare_sync(sync_db):
+    with sync_db.stmt_tracking():
+        changes = await sync_db.prepare(sync=True)
+        stmts = sync_db._tracking.get()
+    assert stmts[0] == (catalog.CATALOG_QUERY, ([schema.name for schema in sync_db.schemas],))
+    assert [sql for sql, _ in stmts[1:]] == changes.statements
+    assert repr(changes) == "<CatalogDiff statements=3 drift=0>"
+    assert all(schema.exists for schema in sync_db.schemas)
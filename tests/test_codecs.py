@@ -0,0 +1,78 @@
+"""Testing of JSON codec functionality."""
+
+import json
+
+import pytest
+
+from everstone.codecs import JSONCodec, LazyJSON
+from everstone.exceptions import DBError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.codecs = dict()
+
+    async def set_type_codec(self, name, *, encoder, decoder, schema, format="text"):
+        self.codecs[name] = (encoder, decoder, schema, format)
+
+
+def test_lazy_json():
+    lazy = LazyJSON('{"a": [1, 2]}')
+    assert repr(lazy) == """<LazyJSON '{"a": [1, 2]}'>"""
+    assert not lazy.decoded
+    assert lazy["a"] == [1, 2]
+    assert lazy.decoded
+    assert "a" in lazy
+    assert list(lazy) == ["a"]
+    assert len(lazy) == 1
+    assert lazy == {"a": [1, 2]}
+    assert lazy == LazyJSON(b'{"a": [1, 2]}')
+
+
+def test_codec_text():
+    codec = JSONCodec()
+    assert codec.encode_text({"a": 1}) == '{"a": 1}'
+    assert codec.decode('{"a": 1}') == {"a": 1}
+    codec = JSONCodec(lambda v: json.dumps(v).encode(), lazy=True)
+    assert codec.encode_text({"a": 1}) == '{"a": 1}'
+    assert isinstance(codec.decode('{"a": 1}'), LazyJSON)
+
+
+def test_codec_binary():
+    codec = JSONCodec(binary=True)
+    assert codec.encode_binary({"a": 1}) == b'{"a": 1}'
+    assert codec.encode_jsonb({"a": 1}) == b'\x01{"a": 1}'
+    assert codec.decode_jsonb(b'\x01{"a": 1}') == {"a": 1}
+    with pytest.raises(DBError):
+        codec.decode_jsonb(b'\x02{"a": 1}')
+
+
+def test_codec_lazy_roundtrip():
+    codec = JSONCodec(lazy=True)
+    assert codec.encode_text(codec.decode(b'{"a": 1}')) == '{"a": 1}'
+    assert codec.encode_binary(codec.decode('{"a": 1}')) == b'{"a": 1}'
+    assert codec.encode_jsonb(codec.decode_jsonb(b'\x01{"a": 1}')) == b'\x01{"a": 1}'
+    lazy = codec.decode('{"a": [1]}')
+    lazy["a"].append(2)
+    assert codec.encode_text(lazy) == '{"a": [1, 2]}'
+
+
+def test_codec_orjson():
+    pytest.importorskip("orjson")
+    codec = JSONCodec.orjson()
+    assert codec.binary
+    assert codec.decode_jsonb(codec.encode_jsonb({"a": 1})) == {"a": 1}
+    assert repr(codec) == "<JSONCodec orjson binary>"
+
+
+@pytest.mark.asyncio
+async def test_codec_register():
+    conn = FakeConnection()
+    codec = JSONCodec()
+    await codec.register(conn)
+    assert conn.codecs["json"] == (codec.encode_text, codec.decode, "pg_catalog", "text")
+    assert conn.codecs["jsonb"] == (codec.encode_text, codec.decode, "pg_catalog", "text")
+    codec = JSONCodec(binary=True)
+    await codec.register(conn)
+    assert conn.codecs["json"] == (codec.encode_binary, codec.decode, "pg_catalog", "binary")
+    assert conn.codecs["jsonb"] == (codec.encode_jsonb, codec.decode_jsonb, "pg_catalog", "binary")
@@ -48,6 +48,44 @@ def test_column_modifiers(test_col):
     assert test_col.sort_direction is None
 
 
+def test_column_views(test_col):
+    view = test_col.desc.as_("alias_a").grouped
+    assert isinstance(view, column.ColumnView)
+    assert view.column is test_col
+    assert view.constraints == test_col.constraints
+    with pytest.raises(AttributeError):
+        view.constraints.add(None)
+    assert (view.name, view.sort_direction, view._grouped) == ("alias_a", "DESC", True)
+    assert view.asc.sort_direction == "ASC"
+    assert view.sort_direction == "DESC"
+    assert view.reset_modifiers() is test_col
+    assert test_col.alias is None
+    assert view.copy().alias == "alias_a"
+    assert not hasattr(view, "__dict__")
+    assert not hasattr(test_col, "__dict__")
+    with pytest.raises(AttributeError):
+        view.alias = "alias_b"
+    with pytest.raises(AttributeError):
+        view.bind_table(None)
+    with pytest.raises(AttributeError):
+        del view.type
+    assert view.alias == "alias_a"
+    assert view.table is test_col.table
+
+
+def test_column_view_shares_definition():
+    col = column.Column("x", types.Integer)
+    view = col.desc
+    everstone.db.Table("late").add_columns(col)
+    col.constraints.add(constraints.NotNull)
+    assert str(view) == str(col) == "public.late.x"
+    assert view.table is col.table
+    assert view.constraints == {constraints.NotNull}
+    col.alias = "y"
+    assert col.name == "y"
+    assert view.name == "x"
+
+
 def test_column_defaults():
     with pytest.raises(SchemaError, match="No default is set*"):
         _ = column.Column("no_default", types.Text).default
@@ -55,15 +93,15 @@ def test_column_defaults():
 
 
 def test_column_aggregates(test_col):
-    assert test_col.avg == "avg(example_column) AS example_column_avg"
-    assert test_col.bit_and == "bit_and(example_column) AS example_column_bit_and"
-    assert test_col.bit_or == "bit_or(example_column) AS example_column_bit_or"
-    assert test_col.bool_and == "bool_and(example_column) AS example_column_bool_and"
-    assert test_col.bool_or == "bool_or(example_column) AS example_column_bool_or"
-    assert test_col.count == "count(example_column) AS example_column_count"
-    assert test_col.max == "max(example_column) AS example_column_max"
-    assert test_col.min == "min(example_column) AS example_column_min"
-    assert test_col.sum == "sum(example_column) AS example_column_sum"
+    assert (test_col.avg.sql, test_col.avg.alias) == ("avg(example_column)", "example_column_avg")
+    assert (test_col.bit_and.sql, test_col.bit_and.alias) == ("bit_and(example_column)", "example_column_bit_and")
+    assert (test_col.bit_or.sql, test_col.bit_or.alias) == ("bit_or(example_column)", "example_column_bit_or")
+    assert (test_col.bool_and.sql, test_col.bool_and.alias) == ("bool_and(example_column)", "example_column_bool_and")
+    assert (test_col.bool_or.sql, test_col.bool_or.alias) == ("bool_or(example_column)", "example_column_bool_or")
+    assert (test_col.count.sql, test_col.count.alias) == ("count(example_column)", "example_column_count")
+    assert (test_col.max.sql, test_col.max.alias) == ("max(example_column)", "example_column_max")
+    assert (test_col.min.sql, test_col.min.alias) == ("min(example_column)", "example_column_min")
+    assert (test_col.sum.sql, test_col.sum.alias) == ("sum(example_column)", "example_column_sum")
 
 
 def test_column_copy(test_col):
@@ -78,3 +116,12 @@ def test_column_copy(test_col):
     c = test_col.grouped
     assert c == test_col
     assert id(c) != test_col
+
+
+def test_column_in_array():
+    col = everstone.db.Table("target_table").Column("testing_c", types.Serial)
+    args = []
+    assert col.in_(range(5000), as_array=True).compile(args) == "public.target_table.testing_c = ANY($1::INTEGER[])"
+    assert args == [list(range(5000))]
+    assert col.not_in([], as_array=True).compile([]) == "public.target_table.testing_c <> ALL($1::INTEGER[])"
+    assert str(col.in_([], as_array=True)) == "public.target_table.testing_c = ANY(ARRAY[]::INTEGER[])"
@@ -0,0 +1,101 @@
+"""Testing of columnar result functionality."""
+
+import array
+
+import pytest
+
+import everstone
+from everstone.exceptions import QueryError
+from everstone.sql import aggregates, columnar, types
+
+everstone.db.disable_execution()
+
+
+@pytest.fixture
+def metrics_table():
+    t = everstone.db.Table("columnar_metrics")
+    t.Column("metric_id", types.BigSerial)
+    t.Column("value", types.DoublePrecision)
+    t.Column("flag", types.Boolean)
+    t.Column("label", types.Text)
+    return t
+
+
+def test_columnar_typecode(metrics_table):
+    cols = metrics_table.columns
+    assert [columnar.typecode(c) for c in cols] == ["q", "d", "b", None]
+    assert columnar.typecode(everstone.Column("small", types.SmallInteger())) == "h"
+    assert columnar.typecode(aggregates.Max(cols.value)) == "d"
+    assert columnar.typecode(aggregates.Count(cols.label)) == "q"
+    assert columnar.typecode(aggregates.Avg(cols.value)) is None
+    assert columnar.typecode("raw_column") is None
+
+
+def test_columnar_buffers():
+    bufs = columnar.buffers(["q", "d", None])
+    columnar.extend(bufs, [(1, 1.5, "a"), (2, 2.5, "b")])
+    columnar.extend(bufs, [])
+    assert bufs == [array.array("q", [1, 2]), array.array("d", [1.5, 2.5]), ["a", "b"]]
+    columnar.extend(bufs, [(None, 3.5, "c")])
+    assert bufs == [[1, 2, None], array.array("d", [1.5, 2.5, 3.5]), ["a", "b", "c"]]
+    assert columnar.finalise(bufs, numpy=False) is bufs
+    bufs = columnar.buffers(["q"])
+    columnar.extend(bufs, [(1,), (2,), (None,), (4,)])
+    assert bufs == [[1, 2, None, 4]]
+
+
+def test_columnar_numpy():
+    np = pytest.importorskip("numpy")
+    bufs = columnar.finalise([array.array("q", [1, 2]), array.array("b", [True, False]), ["a"]], numpy=True)
+    assert bufs[0].dtype == np.int64
+    assert bufs[1].tolist() == [True, False]
+    assert bufs[2] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_columnar_select(metrics_table):
+    s = metrics_table.select(metrics_table.columns.value)
+    assert await s.fetch_columns() == "SELECT public.columnar_metrics.value FROM public.columnar_metrics;"
+
+
+@pytest.mark.asyncio
+async def test_columnar_select_aggregates(metrics_table, monkeypatch):
+    cols = metrics_table.columns
+    received = {}
+
+    async def fetch_columns(sql, *args, columns, **kwargs):
+        received.update(sql=sql, columns=columns)
+
+    monkeypatch.setattr(everstone.db, "fetch_columns", fetch_columns)
+    label_count = aggregates.Count(cols.label)
+    label_count.as_("labels")
+    await metrics_table.select(cols.flag, aggregates.Max(cols.value), label_count).fetch_columns()
+    assert received == {
+        "sql": (
+            "SELECT public.columnar_metrics.flag, max(public.columnar_metrics.value),"
+            " count(public.columnar_metrics.label) AS labels FROM public.columnar_metrics;"
+        ),
+        "columns": {"flag": "b", "max": "d", "labels": "q"},
+    }
+
+    await metrics_table.select(cols.value.sum, cols.label.count).fetch_columns()
+    assert received == {
+        "sql": (
+            "SELECT sum(public.columnar_metrics.value) AS value_sum,"
+            " count(public.columnar_metrics.label) AS label_count FROM public.columnar_metrics;"
+        ),
+        "columns": {"value_sum": None, "label_count": "q"},
+    }
+    await metrics_table.select(cols.flag, "max(public.columnar_metrics.value) AS top").fetch_columns()
+    assert received["columns"] == {"flag": "b", "top": None}
+
+
+@pytest.mark.asyncio
+async def test_columnar_select_duplicate_names(metrics_table):
+    other = everstone.db.Table("columnar_other")
+    other.Column("value", types.Integer)
+    s = metrics_table.select(metrics_table.columns.value, other.columns.value)
+    with pytest.raises(QueryError):
+        await s.fetch_columns()
+    s = metrics_table.select(metrics_table.columns.value, other.columns.value.as_("other_value"))
+    assert "public.columnar_other.value AS other_value" in await s.fetch_columns()
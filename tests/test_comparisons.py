@@ -35,7 +35,24 @@ def test_comparable_operators():
     assert (example.not_ilike("something")) == "'example_text' NOT ILIKE 'something'"
     assert (example.is_("something")) == "'example_text' IS 'something'"
     assert (example.is_not("something")) == "'example_text' IS NOT 'something'"
-    assert (example.in_("something")) == "'example_text' IN 'something'"
+    assert (example.in_("something")) == "'example_text' IN ('something')"
+    assert (example.in_(["a", "b"])) == "'example_text' IN ('a', 'b')"
+    assert (example.in_([])) == "'example_text' IN (NULL)"
+    assert (example.is_(None)) == "'example_text' IS NULL"
+
+
+def test_comparable_parameters():
+    hundred = ComparableTesting(100)
+    c = hundred < 500
+    args = []
+    assert c.compile(args) == "100 < $1"
+    assert args == [500]
+    assert c.args == (500,)
+    c = hundred.between(0, 500) & hundred.in_([1, 2]) | hundred.is_(True)
+    args = []
+    assert c.compile(args) == "((100 BETWEEN $1 AND $2 AND 100 IN ($3, $4)) OR 100 IS TRUE)"
+    assert args == [0, 500, 1, 2]
+    assert (hundred == "it's").compile() == "100 = 'it''s'"
 
 
 def test_condition():
@@ -49,3 +66,59 @@ def test_condition():
     assert c.or_("b") == "(example OR b)"
     assert comparisons.Condition.and_(c, "b") == "(example AND b)"
     assert comparisons.Condition.or_(c, "b") == "(example OR b)"
+
+
+def test_condition_tree():
+    a, b, c = (ComparableTesting(n) for n in (1, 2, 3))
+    nested = ((a == 1) & (b == 2)) & ((c == 3) & (a == 4))
+    assert isinstance(nested, comparisons.And)
+    assert nested.terms == (a == 1, b == 2, c == 3, a == 4)
+    assert nested.compile([]) == "(1 = $1 AND 2 = $2 AND 3 = $3 AND 1 = $4)"
+    assert nested == (a == 1).and_(b == 2, c == 3, a == 4)
+    assert hash(nested) == hash((a == 1).and_(b == 2, c == 3, a == 4))
+    assert nested != (a == 1).and_(b == 2, c == 3, a == 5)
+    assert ((a == 1) | (b == 2) & (c == 3)).compile() == "(1 = 1 OR (2 = 2 AND 3 = 3))"
+    assert (a == 1) == comparisons.Condition("1 = ", comparisons.Parameter(1))
+    assert len({a == 1, a == 1, a == 2}) == 2
+    assert hash(a.in_([1, 2])) == hash(a.in_([1, 2]))
+    assert (a == 1)._key() != (a == True)._key()  # noqa: E712
+    conditions = {a == 1, a == True, a == 1.0, a.in_([1], as_array=True), a.in_([True], as_array=True)}  # noqa: E712
+    assert len(conditions) == 5
+
+
+def test_condition_not():
+    a = ComparableTesting(1)
+    assert str(~(a == 1)) == "NOT (1 = 1)"
+    assert str(~((a == 1) | (a == 2))) == "NOT (1 = 1 OR 1 = 2)"
+    assert ~~(a == 1) == (a == 1)
+    assert repr(~(a == 1)) == '<Not "NOT (1 = 1)">'
+
+
+def test_condition_deep_chain():
+    a = ComparableTesting(1)
+    condition = a == 0
+    for i in range(1, 10000):
+        condition = condition & (a == i)
+    args = []
+    sql = condition.compile(args)
+    assert sql.startswith("(1 = $1 AND 1 = $2")
+    assert sql.endswith("1 = $10000)")
+    assert args == list(range(10000))
+
+
+def test_comparable_in_array():
+    hundred = ComparableTesting(100)
+    c = hundred.in_({5}, as_array=True)
+    assert c.compile([]) == "100 = ANY($1)"
+    assert c.args == ([5],)
+    assert str(hundred.not_in((1, "a"), as_array=True)) == "100 <> ALL(ARRAY[1, 'a'])"
+    assert str(hundred.not_in([1, 2])) == "100 NOT IN (1, 2)"
+    c = hundred.not_in([])
+    assert c.compile([]) == "100 <> ALL($1)"
+    assert c.args == ([],)
+    assert str(hundred.not_in(iter([3]))) == "100 NOT IN (3)"
+    assert hundred.in_("abc", as_array=True).args == (["abc"],)
+    assert hundred.in_(b"abc", as_array=True).args == ([b"abc"],)
+    assert hundred.in_(5, as_array=True).args == ([5],)
+    assert hundred.not_in("abc", as_array=True).args == (["abc"],)
+    assert hundred.not_in(5, as_array=True).args == ([5],)
@@ -60,5 +60,7 @@ def test_constraint_foreign_key():
     assert c.sql == "REFERENCES public.test_table (col_a)"
     c = constraints.ForeignKey(column.Column("col_a", types.Text), table="test_table")
     assert c.sql == "REFERENCES test_table (col_a)"
+    assert c.named("fk_col_a").sql == "CONSTRAINT fk_col_a REFERENCES test_table (col_a)"
+    assert not hasattr(c, "__dict__")
     with pytest.raises(SchemaError):
         _ = constraints.ForeignKey(column.Column("col_a", types.Text))
@@ -0,0 +1,124 @@
+"""Testing of batched row loading functionality."""
+
+import asyncio
+
+import pytest
+
+import everstone
+from everstone.database import Database
+from everstone.exceptions import QueryError, SchemaError
+from everstone.sql import Loader, constraints, types
+
+everstone.db.disable_execution()
+
+
+@pytest.fixture
+def users():
+    db = Database("test_loader")
+    db.disable_execution()
+    table = db.Table("users")
+    table.Column("user_id", types.Integer, constraints.PrimaryKey)
+    table.Column("name", types.Text)
+    queries = []
+
+    async def fetch(sql, *args, **kwargs):
+        queries.append((sql, args))
+        await asyncio.sleep(0)
+        return [{"user_id": key, "name": f"user {key}"} for key in args[0] if key > 0]
+
+    db.fetch = fetch
+    yield table, queries
+    del db["test_loader"]
+
+
+def test_loader_key(users):
+    table, _ = users
+    assert table.loader().key is table.columns.user_id
+    loader = Loader(table, "name", columns=["user_id"])
+    assert loader.columns == [table.columns.user_id, table.columns.name]
+    assert repr(loader) == "<Loader public.users.name>"
+    with pytest.raises(SchemaError):
+        Loader(everstone.db.Table("test_loader_no_key"))
+
+
+@pytest.mark.asyncio
+async def test_loader_batching(users):
+    table, queries = users
+    loader = table.loader()
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(-1))
+    assert results == [{"user_id": 1, "name": "user 1"}, {"user_id": 2, "name": "user 2"}, results[0], None]
+    assert queries == [(
+        "SELECT public.users.user_id, public.users.name FROM public.users"
+        " WHERE public.users.user_id = ANY($1::INTEGER[]);",
+        ([1, 2, -1],),
+    )]
+
+    queries.clear()
+    assert [r["user_id"] for r in await loader.load_many(range(1, 6))] == [1, 2, 3, 4, 5]
+    assert await loader.load(6) == {"user_id": 6, "name": "user 6"}
+    assert [args for _, args in queries] == [([1, 2, 3, 4, 5],), ([6],)]
+
+    queries.clear()
+    loader = table.loader(max_batch=2)
+    await loader.load_many(range(1, 6))
+    assert [args for _, args in queries] == [([1, 2],), ([3, 4],), ([5],)]
+
+
+@pytest.mark.asyncio
+async def test_loader_window(users, monkeypatch):
+    table, queries = users
+    loader = table.loader(window=0.01)
+    loop = asyncio.get_running_loop()
+    scheduled = []
+    monkeypatch.setattr(loop, "call_later", lambda *args, **kwargs: scheduled.append((args, kwargs)))
+
+    first = asyncio.ensure_future(loader.load(1))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)  # a later iteration of the event loop, still within the window
+    second = asyncio.ensure_future(loader.load(2))
+    await asyncio.sleep(0)
+    assert not first.done() and not queries
+
+    [((delay, dispatch), kwargs)] = scheduled
+    assert delay == 0.01
+    kwargs["context"].run(dispatch)
+    assert await asyncio.gather(first, second) == [{"user_id": 1, "name": "user 1"}, {"user_id": 2, "name": "user 2"}]
+    assert [args for _, args in queries] == [([1, 2],)]
+
+
+@pytest.mark.asyncio
+async def test_loader_error(users):
+    table, _ = users
+
+    async def fetch(sql, *args, **kwargs):
+        raise ValueError
+
+    table.db.fetch = fetch
+    loader = table.loader()
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_loader_context(users):
+    table, _ = users
+    connections = []
+
+    async def fetch(sql, *args, **kwargs):
+        connections.append(table.db._connection.get())
+        return []
+
+    table.db.fetch = fetch
+    loader = table.loader()
+
+    async def pinned(key):
+        ctx_token = table.db._connection.set("pinned")
+        try:
+            return await loader.load(key)
+        finally:
+            table.db._connection.reset(ctx_token)
+
+    assert await asyncio.gather(pinned(1), loader.load(2)) == [None, None]
+    assert connections == [None]
+    with pytest.raises(QueryError):
+        table.loader(max_batch=0)
@@ -0,0 +1,101 @@
+"""Testing of statement instrumentation functionality."""
+
+import pytest
+
+import everstone
+from everstone.database import Database
+from everstone.metrics import OVERFLOW_STATEMENT, Metrics
+
+everstone.db.disable_execution()
+
+
+def test_metrics_record():
+    metrics = Metrics(buckets=(0.1, 0.01))
+    assert metrics.buckets == (0.01, 0.1)
+    metrics.record("SELECT  $1;", 0.005, rows=2, acquire=0.001)
+    metrics.record("SELECT $1;\n", 0.05, error=True)
+    metrics.record("SELECT 2;", 5.0)
+    assert len(metrics) == 2
+    assert repr(metrics) == "<Metrics statements=2>"
+    assert repr(metrics["SELECT $1;"]) == "<StatementStats 'SELECT $1;' count=2 errors=1>"
+    assert metrics.snapshot()["SELECT $1;"] == {
+        "count": 2,
+        "errors": 1,
+        "rows": 2,
+        "total_time": 0.055,
+        "acquire_time": 0.001,
+        "histogram": {0.01: 1, 0.1: 2, float("inf"): 2},
+    }
+    assert metrics.snapshot()["SELECT ?;"]["histogram"] == {0.01: 0, 0.1: 0, float("inf"): 1}
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_metrics_normalise():
+    assert Metrics.normalise("SELECT * FROM t1 WHERE a = 'x''y' AND b > 2.5;") == (
+        "SELECT * FROM t1 WHERE a = ? AND b > ?;"
+    )
+    assert Metrics.normalise("SELECT $1, $12 FROM t WHERE a IN ($2, $3,\n $4);") == (
+        "SELECT $1, $12 FROM t WHERE a IN (...);"
+    )
+    assert Metrics.normalise("SELECT 1 FROM t WHERE a in (1, 'b') OR b IN (SELECT 2);") == (
+        "SELECT ? FROM t WHERE a IN (...) OR b IN (SELECT ?);"
+    )
+    assert Metrics.normalise('SELECT "col 1" FROM t;') == 'SELECT "col 1" FROM t;'
+
+
+def test_metrics_max_statements():
+    metrics = Metrics(max_statements=2)
+    for i in range(5):
+        metrics.record(f"SELECT * FROM t{i};", 0.01)
+    metrics.record("SELECT * FROM t0;", 0.01)
+    assert len(metrics) == 3
+    assert metrics["SELECT * FROM t0;"].count == 2
+    assert metrics[OVERFLOW_STATEMENT].count == 3
+
+
+def test_metrics_prometheus():
+    metrics = Metrics(buckets=(0.1,))
+    metrics.record('SELECT "a";', 0.05, rows=1)
+    assert metrics.prometheus() == "\n".join([
+        "# HELP everstone_statement_duration_seconds Time spent executing statements.",
+        "# TYPE everstone_statement_duration_seconds histogram",
+        'everstone_statement_duration_seconds_bucket{statement="SELECT \\"a\\";",le="0.1"} 1',
+        'everstone_statement_duration_seconds_bucket{statement="SELECT \\"a\\";",le="+Inf"} 1',
+        'everstone_statement_duration_seconds_sum{statement="SELECT \\"a\\";"} 0.05',
+        'everstone_statement_duration_seconds_count{statement="SELECT \\"a\\";"} 1',
+        "# HELP everstone_statement_errors_total Statement executions that raised an error.",
+        "# TYPE everstone_statement_errors_total counter",
+        'everstone_statement_errors_total{statement="SELECT \\"a\\";"} 0',
+        "# HELP everstone_statement_rows_total Rows returned or affected by statements.",
+        "# TYPE everstone_statement_rows_total counter",
+        'everstone_statement_rows_total{statement="SELECT \\"a\\";"} 1',
+        "# HELP everstone_statement_acquire_seconds_total Time spent waiting to acquire a pool connection.",
+        "# TYPE everstone_statement_acquire_seconds_total counter",
+        'everstone_statement_acquire_seconds_total{statement="SELECT \\"a\\";"} 0.0',
+    ]) + "\n"
+
+
+def test_metrics_row_count():
+    assert Database._row_count("fetch", [1, 2, 3]) == 3
+    assert Database._row_count("fetch", None) == 0
+    assert Database._row_count("fetchrow", None) == 0
+    assert Database._row_count("fetchval", "INSERT 0 5") == 1
+    assert Database._row_count("execute", "INSERT 0 5") == 5
+    assert Database._row_count("execute", "CREATE TABLE") == 0
+    assert Database._row_count("copy_records_to_table", "COPY 10") == 10
+
+
+@pytest.mark.asyncio
+async def test_metrics_database():
+    db = Database("test_db_metrics")
+    db.disable_execution()
+    metrics = db.enable_instrumentation()
+    assert db.metrics is metrics
+    await db.execute("SELECT 1;")
+    await db.fetch("SELECT 1;")
+    assert metrics["SELECT 1;"].count == 2
+    db.disable_instrumentation()
+    await db.execute("SELECT 1;")
+    assert metrics["SELECT 1;"].count == 2
+    del db["test_db_metrics"]
@@ -0,0 +1,56 @@
+"""Testing of generated Record class functionality."""
+
+import pytest
+
+import everstone
+from everstone.exceptions import QueryError
+from everstone.sql import record, types
+
+everstone.db.disable_execution()
+
+
+@pytest.fixture
+def user_table():
+    t = everstone.db.Table("record_users")
+    t.Column("user_id", types.BigInteger)
+    t.Column("name", types.Text)
+    return t
+
+
+def test_record_class(user_table):
+    cls = user_table.record_class
+    assert cls is user_table.record_class
+    assert cls.__name__ == "RecordUsersRecord"
+    assert cls.__slots__ == ("user_id", "name")
+    assert cls.__annotations__ == {"user_id": int, "name": str}
+    assert issubclass(cls, record.Record)
+    user_table.Column("active", types.Boolean)
+    assert user_table.record_class is not cls
+    assert user_table.record_class.__slots__ == ("user_id", "name", "active")
+
+
+def test_record_instances(user_table):
+    cls = user_table.record_class
+    row = cls(1, name="a")
+    assert not hasattr(row, "__dict__")
+    assert row.user_id == 1
+    assert row.name == "a"
+    assert row.as_dict() == {"user_id": 1, "name": "a"}
+    assert repr(row) == "<RecordUsersRecord user_id=1 name='a'>"
+    assert row == cls.from_row({"user_id": 1, "name": "a"})
+    assert row != cls.from_row({"user_id": 2})
+    assert row != (1, "a")
+    with pytest.raises(AttributeError):
+        row.missing = True
+    with pytest.raises(QueryError, match="'total'"):
+        cls.from_row({"user_id": 1, "total": 2})
+    partial = cls.from_row({"user_id": 1})
+    assert partial.copy() == partial and partial.copy() is not partial
+    assert not hasattr(partial.copy(), "name")
+
+
+@pytest.mark.asyncio
+async def test_record_select(user_table):
+    s = user_table.select(user_table.columns.user_id).into(user_table.record_class)
+    assert s._into is user_table.record_class
+    assert await s == "SELECT public.record_users.user_id FROM public.record_users;"
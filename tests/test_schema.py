@@ -30,12 +30,13 @@ async def test_schema_create(example_schema):
 
 
 @pytest.mark.asyncio
-async def test_schema_drop(example_schema):
-    assert example_schema.exists is None
-    assert await example_schema.drop() == "DROP SCHEMA schema_a;"
-    assert example_schema.exists is False
-    assert await example_schema.drop(if_exists=True) == "DROP SCHEMA IF EXISTS schema_a;"
-    assert await example_schema.drop(if_exists=True, cascade=True) == "DROP SCHEMA IF EXISTS schema_a CASCADE;"
+async def test_schema_drop():
+    schema = everstone.db.Schema("schema_drop")
+    assert schema.exists is None
+    assert await schema.drop() == "DROP SCHEMA schema_drop;"
+    assert schema.exists is False
+    assert await schema.drop(if_exists=True) == "DROP SCHEMA IF EXISTS schema_drop;"
+    assert await schema.drop(if_exists=True, cascade=True) == "DROP SCHEMA IF EXISTS schema_drop CASCADE;"
 
 
 @pytest.mark.asyncio
@@ -55,6 +56,8 @@ async def test_schema_prepare(example_schema):
         await example_schema.prepare()
         stmts = everstone.db._tracking.get()
     assert ("CREATE SCHEMA IF NOT EXISTS schema_a;", ()) in stmts
-    assert ("CREATE TABLE IF NOT EXISTS table_b (b_key_column INTEGER PRIMARY KEY);", ()) in stmts
-    assert ("CREATE TABLE IF NOT EXISTS table_a (a_key_column TEXT PRIMARY KEY);", ()) in stmts
+    assert ("CREATE TABLE IF NOT EXISTS schema_a.table_b (b_key_column INTEGER PRIMARY KEY);", ()) in stmts
+    assert ("CREATE TABLE IF NOT EXISTS schema_a.table_a (a_key_column TEXT PRIMARY KEY);", ()) in stmts
     assert len(stmts) == 3
+    assert everstone.db.Schema("schema_a").tables == example_schema.tables
+    assert len(example_schema.tables) == 2
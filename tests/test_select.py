@@ -3,6 +3,7 @@
 import pytest
 
 import everstone
+from everstone.exceptions import QueryError
 from everstone.sql import constraints, types
 
 everstone.db.disable_execution()
@@ -45,4 +46,96 @@ async def test_select_grouped(sample_table):
     s = sample_table.select(col_a.count)
     s.group_by(col_a)
     assert s.groups == [col_a]
-    assert await s == "SELECT count(public.sample_table.col_a) AS col_a_count GROUP BY public.sample_table.col_a;"
+    assert await s == (
+        "SELECT count(public.sample_table.col_a) AS col_a_count FROM public.sample_table"
+        " GROUP BY public.sample_table.col_a;"
+    )
+
+
+@pytest.mark.asyncio
+async def test_select_where(sample_table):
+    col_a = sample_table.columns.col_a
+    col_b = sample_table.columns.col_b
+    s = sample_table.select(col_a)
+    s.where(col_b > 5, col_a.like("a%"))
+    assert s.sql == (
+        "SELECT public.sample_table.col_a FROM public.sample_table"
+        " WHERE public.sample_table.col_b > $1 AND public.sample_table.col_a LIKE $2;"
+    )
+    assert s.args == (5, "a%")
+    assert await s == (s.sql, 5, "a%")
+    s.where.clear()
+    s.where(col_b > 6, col_a.like("b%"))
+    assert await s == (s.sql, 6, "b%")
+
+
+@pytest.mark.asyncio
+async def test_select_fetch(sample_table):
+    col_a = sample_table.columns.col_a
+    s = sample_table.select(col_a)
+    s.where(col_a == "x")
+    expected = ("SELECT public.sample_table.col_a FROM public.sample_table WHERE public.sample_table.col_a = $1;", "x")
+    assert await s.fetch() == expected
+    assert await s.fetchrow() == expected
+    assert await s.fetchval() == expected
+
+
+@pytest.mark.asyncio
+async def test_select_stream(sample_table):
+    s = sample_table.select(sample_table.columns.col_a)
+    rows = [r async for r in s.stream(batch=500, chunked=True)]
+    assert rows == ["SELECT public.sample_table.col_a FROM public.sample_table;"]
+
+
+def test_select_order_limit(sample_table):
+    col_a = sample_table.columns.col_a
+    col_b = sample_table.columns.col_b
+    s = sample_table.select(col_a).order_by(col_b.desc, col_a).limit(10).offset(20)
+    assert s.compile() == (
+        "SELECT public.sample_table.col_a FROM public.sample_table"
+        " ORDER BY public.sample_table.col_b DESC, public.sample_table.col_a ASC LIMIT $1 OFFSET $2;",
+        (10, 20),
+    )
+
+
+def test_select_page_after(sample_table):
+    col_a = sample_table.columns.col_a
+    col_b = sample_table.columns.col_b
+    s = sample_table.select(col_a, col_b)
+    with pytest.raises(QueryError):
+        s.page_after(None, 10)
+    s.where(col_b > 0)
+    s.order_by(col_b, col_a).offset(5)
+    assert s.page_after(None, 10).compile() == (
+        "SELECT public.sample_table.col_a, public.sample_table.col_b FROM public.sample_table"
+        " WHERE public.sample_table.col_b > $1"
+        " ORDER BY public.sample_table.col_b ASC, public.sample_table.col_a ASC LIMIT $2;",
+        (0, 10),
+    )
+    assert s.page_after({"col_a": "x", "col_b": 7}, 10).compile() == (
+        "SELECT public.sample_table.col_a, public.sample_table.col_b FROM public.sample_table"
+        " WHERE public.sample_table.col_b > $1"
+        " AND (public.sample_table.col_b, public.sample_table.col_a) > ($2, $3)"
+        " ORDER BY public.sample_table.col_b ASC, public.sample_table.col_a ASC LIMIT $4;",
+        (0, 7, "x", 10),
+    )
+    s.order_by(col_b.desc)
+    assert s.page_after(sample_table.record_class(col_b=7), 10).args == (0, 7, 10)
+    assert "public.sample_table.col_b < $2" in s.sql
+    s.order_by(col_b.desc, col_a.asc)
+    assert s.page_after((7, "x"), 10).compile() == (
+        "SELECT public.sample_table.col_a, public.sample_table.col_b FROM public.sample_table"
+        " WHERE public.sample_table.col_b > $1"
+        " AND ((public.sample_table.col_b < $2)"
+        " OR (public.sample_table.col_b = $3 AND public.sample_table.col_a > $4))"
+        " ORDER BY public.sample_table.col_b DESC, public.sample_table.col_a ASC LIMIT $5;",
+        (0, 7, 7, "x", 10),
+    )
+    with pytest.raises(QueryError):
+        s.page_after((7,), 10)
+
+    aliased = sample_table.select(col_a.as_("a_alias"), col_b)
+    aliased.order_by(col_a.desc, col_b.desc)
+    assert aliased.page_after({"a_alias": "x", "col_b": 7}, 10).args == ("x", 7, 10)
+    aliased.order_by("col_b")
+    assert aliased.page_after({"a_alias": "x", "col_b": 7}, 10).args == (7, 10)
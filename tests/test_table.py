@@ -3,8 +3,9 @@
 import pytest
 
 import everstone
+from everstone import database
 from everstone.exceptions import SchemaError
-from everstone.sql import constraints, types
+from everstone.sql import constraints, table, types
 
 everstone.db.disable_execution()
 
@@ -37,11 +38,12 @@ async def test_table_create():
     with pytest.raises(AttributeError):
         _ = t.columns.col_nonexisting
     assert await t.create() == "CREATE TABLE test_table_a (col_a TEXT, col_b INTEGER);"
+    assert t.create_sql(qualified=True) == "CREATE TABLE public.test_table_a (col_a TEXT, col_b INTEGER);"
     with db.stmt_tracking():
         await t.prepare()
         stmts = everstone.db._tracking.get()
     assert stmts == [
-        ("CREATE TABLE IF NOT EXISTS test_table_a (col_a TEXT, col_b INTEGER);", ())
+        ("CREATE TABLE IF NOT EXISTS public.test_table_a (col_a TEXT, col_b INTEGER);", ())
     ]
 
 
@@ -71,3 +73,97 @@ def test_table_select():
     s = t.select(a)
     assert s.db is everstone.db
     assert len(s._columns) == 1
+
+
+@pytest.mark.asyncio
+async def test_table_copy_records():
+    t = everstone.db.Table("test_table_copy")
+    a = t.Column("col_a", types.Text)
+    t.Column("col_b", types.Integer)
+    assert await t.copy_records([("a", 1)]) == "COPY public.test_table_copy (col_a, col_b) FROM STDIN (FORMAT binary);"
+    sql = await t.copy_records([("a",)], columns=[a])
+    assert sql == "COPY public.test_table_copy (col_a) FROM STDIN (FORMAT binary);"
+    with pytest.raises(SchemaError):
+        await t.copy_records([], columns=["col_c"])
+    assert list(t._record_tuples([{"col_b": 2, "col_a": "b"}, ("c", 3)], ["col_a", "col_b"])) == [("b", 2), ("c", 3)]
+
+    async def records():
+        yield {"col_b": 2, "col_a": "b"}
+
+    assert [r async for r in t._arecord_tuples(records(), ["col_a", "col_b"])] == [("b", 2)]
+
+    async def many():
+        for i in range(5):
+            yield ("a", i)
+
+    assert [len(b) async for b in database.batches(many(), 2)] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_table_upsert_many():
+    t = everstone.db.Table("test_table_upsert")
+    a = t.Column("col_a", types.Serial, constraints.PrimaryKey)
+    b = t.Column("col_b", types.Text)
+    assert t.primary_key == (a,)
+    sql = (
+        "INSERT INTO public.test_table_upsert (col_a, col_b) SELECT * FROM unnest($1::INTEGER[], $2::TEXT[])"
+        " ON CONFLICT (col_a) DO UPDATE SET col_b = EXCLUDED.col_b;"
+    )
+    assert await t.upsert_many([(1, "a"), {"col_b": "b", "col_a": 2}]) == (sql, [1, 2], ["a", "b"])
+    assert await t.upsert_many([]) == (sql, [], [])
+    rows = [(1, "a"), (2, "b"), {"col_a": 1, "col_b": "c"}]
+    assert await t.upsert_many(rows) == (sql, [1, 2], ["c", "b"])
+    assert (await t.upsert_many(rows, conflict=b))[1:] == ([1, 2, 1], ["a", "b", "c"])
+    assert (await t.upsert_many([("a",), ("a",)], columns=[b], conflict=a))[1:] == (["a", "a"],)
+    assert t.upsert_sql([a], conflict=a) == (
+        "INSERT INTO public.test_table_upsert (col_a) SELECT * FROM unnest($1::INTEGER[])"
+        " ON CONFLICT (col_a) DO NOTHING;"
+    )
+    with pytest.raises(SchemaError):
+        t.upsert_sql(conflict=[])
+    with pytest.raises(SchemaError):
+        t.upsert_sql(["col_c"])
+    t.Column("col_tags", types.Array(types.Text))
+    with pytest.raises(SchemaError, match="col_tags"):
+        await t.upsert_many([(1, "a", ["x", "y"])])
+    assert t.upsert_sql([a, b]) == sql
+
+
+@pytest.mark.asyncio
+async def test_table_notify_trigger():
+    t = everstone.db.Table("test_table_notify")
+    sql = t.notify_trigger_sql("it's")
+    assert sql.startswith("CREATE OR REPLACE FUNCTION public.everstone_notify() RETURNS trigger")
+    assert "DROP TRIGGER IF EXISTS everstone_notify ON public.test_table_notify;" in sql
+    assert sql.endswith(
+        "CREATE TRIGGER everstone_notify AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.test_table_notify"
+        " FOR EACH STATEMENT EXECUTE FUNCTION public.everstone_notify('it''s');"
+    )
+    assert await t.create_notify_trigger() == t.notify_trigger_sql("everstone_invalidation")
+
+
+def test_table_composite_primary_key():
+    t = everstone.db.Table("test_table_composite")
+    a = t.Column("col_a", types.Text)
+    b = t.Column("col_b", types.BigSerial)
+    t.add_constraints(constraints.PrimaryKey.columns(a, b))
+    assert t.primary_key == (a, b)
+    assert b.cast == "BIGINT"
+
+
+def test_table_dependency_order():
+    parent = everstone.db.Table("test_order_parent")
+    parent_id = parent.Column("parent_id", types.Integer, constraints.PrimaryKey)
+    child = everstone.db.Table("test_order_child")
+    child_id = child.Column("child_id", types.Integer, constraints.ForeignKey(parent_id))
+    grandchild = everstone.db.Table("test_order_grandchild")
+    grandchild.Column("child_id", types.Integer)
+    grandchild.add_constraints(constraints.NamedConstraint(constraints.ForeignKey(child_id), "grandchild_fk"))
+    other = everstone.db.Table("test_order_other")
+    other.Column("parent_id", types.Integer, constraints.ForeignKey(parent_id, table="test_order_parent"))
+    assert child.references == {parent}
+    assert grandchild.references == {child}
+    assert table.dependency_order([grandchild, other, child, parent]) == [[parent], [child, other], [grandchild]]
+    parent.add_constraints(constraints.ForeignKey(child_id))
+    with pytest.raises(SchemaError, match="Circular"):
+        table.dependency_order([grandchild, child, parent])
@@ -25,14 +25,16 @@ def test_where(example_table):
     s.where.clear()
     assert s.where.sql == ""
     s.where(a=="john", b >= 100)
-    assert s.where.sql == "public.sample_table.col_a = 'john' AND public.sample_table.col_b >= 100"
+    assert s.where.sql == "public.sample_table.col_a = $1 AND public.sample_table.col_b >= $2"
+    assert s.where.args == ("john", 100)
     s.where.clear()
     s.where(a.is_(True) | (a == 100) & b.ilike("dan"))
     assert s.where.sql == (
         "(public.sample_table.col_a IS TRUE"
-        " OR (public.sample_table.col_a = 100"
-        " AND public.sample_table.col_b ILIKE 'dan'))"
+        " OR (public.sample_table.col_a = $1"
+        " AND public.sample_table.col_b ILIKE $2))"
     )
+    assert s.where.args == (100, "dan")
     s.where.clear()
     s.where("string_example IS NOT NULL")
     assert s.where.sql == "string_example IS NOT NULL"